@@ -50,6 +50,38 @@ CHART_INFO_FIELDS = [
     "effector",
     "illustrator",
 ]
+TEXT_INPUT_FIELDS = [
+    "title",
+    "title_yomigana",
+    "artist",
+    "artist_yomigana",
+    "ascii_label",
+    "release_date",
+    "effector",
+    "illustrator",
+]
+EXPORT_BUTTONS = [
+    "vox_button",
+    "xml_button",
+    "2dx_button",
+    "jackets_button",
+]
+# fmt: off
+TOGGLEABLE_BUTTONS = [
+    # Main buttons
+    "open_button", *EXPORT_BUTTONS,
+    # Effect definition buttons
+    "effect_def_new",
+    "effect_def_update",
+    "effect_def_delete",
+]
+# fmt: on
+TEXT_INPUT_DEBOUNCE_TIME = 0.1
+"""Minimum time (in seconds) between two consecutive updates from the same text input."""
+TEXT_INPUT_FLUSH_FRAMES = 6
+BACKGROUND_CHOICES = [str(gmbg) for gmbg in GameBackground]
+INFVER_CHOICES = [str(inf) for inf in InfVer]
+DIFFICULTY_CHOICES = [str(diff) for diff in DifficultySlot]
 YOMIGANA_VALIDATION_REGEX = re.compile("^[\uFF66-\uFF9F]+")
 ENUM_REGEX = re.compile(r"\((\d+)\)")
 GREY_TEXT_COLOR = 120, 120, 120, 255
@@ -66,6 +98,31 @@ class FunctionHandler(logging.Handler):
         self._handler(self.format(record))
 
 
+class DuplicateWarningFilter(logging.Filter):
+    _seen: set[tuple[str, int, str]]
+
+    def __init__(self, name: str = "") -> None:
+        super().__init__(name)
+        self._seen = set()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Parser loops can emit the same warning many times; only show it once per user operation
+        # Warnings from the same line can have different arguments, so the formatted message is part of the key
+        try:
+            message = record.getMessage()
+        except Exception:
+            # Formatting errors are reported by the handler, so fall back to the raw message and arguments here
+            message = f"{record.msg!s} {record.args!r}"
+        key = (record.pathname, record.lineno, message)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def reset(self) -> None:
+        self._seen.clear()
+
+
 class KSH2VOXApp:
     ui: dict[str, ObjectID] = dict()
     reverse_ui_map: dict[ObjectID, str] = dict()
@@ -81,16 +138,26 @@ class KSH2VOXApp:
     gmbg_images: list[list[float]] = list()
     gmbg_image_index: int = 0
     popup_result: bool = False
+    log_timestamp_second: int = -1
+    log_timestamp: str = ""
 
     current_file_path: Path
     effect_params: dict[ObjectID, dict[str, ObjectID]]
     autotab_list: dict[ObjectID, TimePoint]
+    pending_updates: dict[ObjectID, Any]
+    last_update_time: dict[ObjectID, float]
+    min_bpm_id: ObjectID
+    max_bpm_id: ObjectID
+    enum_combo_ids: set[ObjectID]
 
     logger: logging.Logger
+    warning_filter: DuplicateWarningFilter
 
     def __init__(self):
         self.gmbg_data = get_game_backgrounds()
         self.effect_params = {}
+        self.pending_updates = {}
+        self.last_update_time = {}
 
         logging.basicConfig(format="[%(levelname)s %(asctime)s] %(name)s: %(message)s", level=logging.DEBUG)
 
@@ -99,6 +166,8 @@ class KSH2VOXApp:
         warning_handler = FunctionHandler(self.log)
         warning_handler.setLevel(logging.WARNING)
         warning_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        self.warning_filter = DuplicateWarningFilter()
+        warning_handler.addFilter(self.warning_filter)
         logging.getLogger("").addHandler(warning_handler)
 
         dpg.create_context()
@@ -197,13 +266,13 @@ class KSH2VOXApp:
                             callback=self.update_and_validate,
                         )
                         self.ui["background"] = dpg.add_combo(
-                            list(str(gmbg) for gmbg in GameBackground),
+                            BACKGROUND_CHOICES,
                             label="Game background",
                             default_value=str(GameBackground.BOOTH_BRIDGE),
                             callback=self.update_and_validate,
                         )
                         self.ui["inf_ver"] = dpg.add_combo(
-                            list(str(inf) for inf in InfVer),
+                            INFVER_CHOICES,
                             label="Infinite version",
                             default_value=str(InfVer.INFINITE),
                             callback=self.update_and_validate,
@@ -217,7 +286,7 @@ class KSH2VOXApp:
                             label="Level", clamped=True, min_value=1, max_value=20, callback=self.update_and_validate
                         )
                         self.ui["difficulty"] = dpg.add_combo(
-                            list(str(diff) for diff in DifficultySlot),
+                            DIFFICULTY_CHOICES,
                             label="Difficulty",
                             callback=self.update_and_validate,
                         )
@@ -367,6 +436,14 @@ class KSH2VOXApp:
 
         dpg.bind_item_theme(self.ui["primary_window"], primary_window_theme)
 
+        # All callback-bearing items exist by now, so the reverse lookup can be built in one go
+        self.reverse_ui_map = {uuid: obj_name for obj_name, uuid in self.ui.items()}
+
+        # Item IDs checked on every update_and_validate call
+        self.min_bpm_id = self.ui["min_bpm"]
+        self.max_bpm_id = self.ui["max_bpm"]
+        self.enum_combo_ids = {self.ui["background"], self.ui["inf_ver"], self.ui["difficulty"]}
+
         # ================================
 
         dpg.set_primary_window(self.ui["primary_window"], True)
@@ -377,17 +454,17 @@ class KSH2VOXApp:
         dpg.destroy_context()
 
     def get_obj_name(self, uuid: ObjectID):
-        if uuid not in self.reverse_ui_map:
-            for obj_name, c_uuid in self.ui.items():
-                if uuid == c_uuid:
-                    self.reverse_ui_map[uuid] = obj_name
-                    break
-
         return self.reverse_ui_map[uuid]
 
     def log(self, message):
+        # Timestamps only have a resolution of one second, so only reformat them when the second changes
+        now = int(time.time())
+        if now != self.log_timestamp_second:
+            self.log_timestamp_second = now
+            self.log_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        # Logs are reverse chronological -- new lines are inserted at the top, so the log never needs scrolling
         self.ui["log_last_line"] = dpg.add_text(
-            f'[{time.strftime("%H:%M:%S", time.localtime())}] {message}',
+            f"[{self.log_timestamp}] {message}",
             parent=self.ui["log"],
             before=self.ui["log_last_line"],
         )
@@ -425,15 +502,15 @@ class KSH2VOXApp:
 
     def update_and_validate(self, sender: ObjectID, app_data: Any):
         # Validation
-        if sender == self.ui["min_bpm"]:
-            if app_data > (value := dpg.get_value(self.ui["max_bpm"])):
+        if sender == self.min_bpm_id:
+            if app_data > (value := dpg.get_value(self.max_bpm_id)):
                 dpg.set_value(sender, value)
-        elif sender == self.ui["max_bpm"]:
-            if app_data < (value := dpg.get_value(self.ui["min_bpm"])):
+        elif sender == self.max_bpm_id:
+            if app_data < (value := dpg.get_value(self.min_bpm_id)):
                 dpg.set_value(sender, value)
 
         # Convert value back to enum
-        if sender in [self.ui["background"], self.ui["inf_ver"], self.ui["difficulty"]]:
+        if sender in self.enum_combo_ids:
             regex_match = ENUM_REGEX.search(app_data)
             if regex_match is not None:
                 app_data = int(regex_match.group(1))
@@ -443,9 +520,29 @@ class KSH2VOXApp:
             self.background_id = app_data
             self.gmbg_available = self.gmbg_data.has_image(self.background_id)
 
+        # Typing into text inputs fires this on every keystroke, so only commit those once in a while
+        obj_name = self.get_obj_name(sender)
+        if obj_name in TEXT_INPUT_FIELDS:
+            now = time.monotonic()
+            if now - self.last_update_time.get(sender, 0) < TEXT_INPUT_DEBOUNCE_TIME:
+                if not self.pending_updates:
+                    dpg.set_frame_callback(dpg.get_frame_count() + TEXT_INPUT_FLUSH_FRAMES, self.flush_pending_updates)
+                self.pending_updates[sender] = app_data
+                return
+            self.last_update_time[sender] = now
+            self.pending_updates.pop(sender, None)
+
+        self.commit_update(obj_name, app_data)
+
+    def flush_pending_updates(self):
+        for sender, app_data in self.pending_updates.items():
+            self.last_update_time[sender] = time.monotonic()
+            self.commit_update(self.get_obj_name(sender), app_data)
+        self.pending_updates.clear()
+
+    def commit_update(self, obj_name: str, app_data: Any):
         # Update parser state
         try:
-            obj_name = self.get_obj_name(sender)
             if obj_name in SONG_INFO_FIELDS:
                 setattr(
                     self.song_chart_data.song_info,
@@ -556,7 +653,7 @@ class KSH2VOXApp:
             autotab_setting.effect2.effect_index += 1
 
         self.song_chart_data.chart_info.effect_list.insert(effect_index, EffectEntry())
-        self.song_chart_data.chart_info.autotab_list.insert(effect_index, AutoTabEntry(effect_index))
+        self.song_chart_data.chart_info.autotab_list.insert(effect_index, AutoTabEntry.from_index(effect_index))
 
         self.populate_effects_list(effect_index)
         self.update_laser_effect_combo_box()
@@ -567,22 +664,29 @@ class KSH2VOXApp:
         effect_1_index = self.get_combo_index(self.ui["effect_def_1_combo"])
         effect_2_index = self.get_combo_index(self.ui["effect_def_2_combo"])
 
-        effect_1 = enum_to_effect(FXType(effect_1_index))()
-        effect_2 = enum_to_effect(FXType(effect_2_index))()
+        effect_1_class = enum_to_effect(FXType(effect_1_index))
+        effect_2_class = enum_to_effect(FXType(effect_2_index))
 
-        pairs: list[tuple[Effect, str]] = [(effect_1, "effect_def_1_combo"), (effect_2, "effect_def_2_combo")]
-        for effect_obj, ui_key in pairs:
+        # Effects are immutable, so their parameters are collected before constructing them
+        new_effects: list[Effect] = []
+        pairs: list[tuple[type[Effect], str]] = [
+            (effect_1_class, "effect_def_1_combo"),
+            (effect_2_class, "effect_def_2_combo"),
+        ]
+        for effect_class, ui_key in pairs:
+            params: dict[str, Any] = {}
             for param_name, obj_id in self.effect_params[self.ui[ui_key]].items():
-                field_data: Field = effect_obj.__dataclass_fields__[param_name]
+                field_data: Field = effect_class.__dataclass_fields__[param_name]
                 param_value = dpg.get_value(obj_id)
                 param_type = field_data.type
                 # If it's an enum, it needs to be converted to the underlying value
                 if issubclass(param_type, Enum):
                     param_value = self.get_combo_index(obj_id)
-                setattr(effect_obj, param_name, param_type(param_value))
+                params[param_name] = param_type(param_value)
+            new_effects.append(effect_class(**params))
 
-        self.song_chart_data.chart_info.effect_list[effect_index] = EffectEntry(effect_1, effect_2)
-        self.song_chart_data.chart_info.autotab_list[effect_index] = AutoTabEntry(effect_index)
+        self.song_chart_data.chart_info.effect_list[effect_index] = EffectEntry(*new_effects)
+        self.song_chart_data.chart_info.autotab_list[effect_index] = AutoTabEntry.from_index(effect_index)
 
         self.populate_effects_list(effect_index)
         self.update_laser_effect_combo_box()
@@ -761,6 +865,7 @@ class KSH2VOXApp:
 
             with self.current_file_path.open("r", encoding="utf-8-sig") as f:
                 self.song_chart_data = KSHParser().parse(f)
+            self.pending_updates.clear()
 
             self.current_path = self.current_file_path.parent
             self.log(
@@ -768,10 +873,13 @@ class KSH2VOXApp:
                 f"({SLOT_MAPPING[self.song_chart_data.chart_info.difficulty]} {self.song_chart_data.chart_info.level})"
             )
 
-            for field in SONG_INFO_FIELDS:
-                dpg.set_value(self.ui[field], getattr(self.song_chart_data.song_info, field))
-            for field in CHART_INFO_FIELDS:
-                dpg.set_value(self.ui[field], getattr(self.song_chart_data.chart_info, field))
+            song_info = self.song_chart_data.song_info
+            chart_info = self.song_chart_data.chart_info
+            field_values = [(self.ui[field], getattr(song_info, field)) for field in SONG_INFO_FIELDS]
+            field_values += [(self.ui[field], getattr(chart_info, field)) for field in CHART_INFO_FIELDS]
+            with dpg.mutex():
+                for item, value in field_values:
+                    dpg.set_value(item, value)
 
             dpg.configure_item(self.ui["effect_def_1_combo"], items=list(FXType))
             dpg.configure_item(self.ui["effect_def_2_combo"], items=list(FXType))
@@ -786,14 +894,13 @@ class KSH2VOXApp:
         # Remove placeholder text and show hidden parts
         dpg.show_item(self.ui["inner_info_container"])
 
-        # Main buttons
-        dpg.configure_item(self.ui["vox_button"], enabled=True)
-        dpg.configure_item(self.ui["xml_button"], enabled=True)
-        dpg.configure_item(self.ui["2dx_button"], enabled=True)
-        dpg.configure_item(self.ui["jackets_button"], enabled=True)
+        with dpg.mutex():
+            # Main buttons
+            for button in EXPORT_BUTTONS:
+                dpg.configure_item(self.ui[button], enabled=True)
 
-        # Effect definition buttons
-        self.update_effect_def_button_state()
+            # Effect definition buttons
+            self.update_effect_def_button_state()
 
     def validate_metadata(self):
         title_check = YOMIGANA_VALIDATION_REGEX.match(self.song_chart_data.song_info.title_yomigana)
@@ -1011,31 +1118,28 @@ class KSH2VOXApp:
 
 class disable_buttons:
     app: KSH2VOXApp
-    buttons: list[str]
-    button_state: dict[str, bool]
+    button_state: dict[ObjectID, bool]
 
     def __init__(self, app: KSH2VOXApp):
         self.app = app
-        # fmt: off
-        self.buttons = [
-            # Main buttons
-            "open_button", "vox_button", "xml_button", "2dx_button", "jackets_button",
-            # Effect definition buttons
-            "effect_def_new",
-            "effect_def_update",
-            "effect_def_delete",
-        ]
-        # fmt: on
         self.button_state = {}
 
     def __enter__(self):
-        for button in self.buttons:
-            self.button_state[button] = dpg.get_item_configuration(self.app.ui[button])["enabled"]
-            dpg.configure_item(self.app.ui[button], enabled=False)
+        # Every user operation starts with a clean slate, so repeated exports still show their warnings
+        self.app.warning_filter.reset()
+        # Make sure the chart data is up to date before doing anything with it
+        self.app.flush_pending_updates()
+        # Toggle all buttons within the same frame
+        with dpg.mutex():
+            for button in TOGGLEABLE_BUTTONS:
+                button_id = self.app.ui[button]
+                self.button_state[button_id] = dpg.get_item_configuration(button_id)["enabled"]
+                dpg.configure_item(button_id, enabled=False)
 
     def __exit__(self, *args, **kwargs):
-        for button, state in self.button_state.items():
-            dpg.configure_item(self.app.ui[button], enabled=state)
+        with dpg.mutex():
+            for button_id, state in self.button_state.items():
+                dpg.configure_item(button_id, enabled=state)
 
 
 class show_throbber:
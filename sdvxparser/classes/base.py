@@ -3,6 +3,7 @@ Base, generic classes supporting other more specialized classes.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import ClassVar
 
 __all__ = [
     "AbstractDataclass",
@@ -15,8 +16,15 @@ __all__ = [
 class AbstractDataclass(ABC):
     """An abstract base class for dataclasses."""
 
+    _abstract: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved once per class, so instantiation only needs a single attribute lookup
+        cls._abstract = cls.__bases__[0] is AbstractDataclass
+
     def __new__(cls, *args, **kwargs):
-        if cls == AbstractDataclass or cls.__bases__[0] == AbstractDataclass:
+        if cls._abstract:
             raise TypeError("Cannot instantiate abstract class.")
         return super().__new__(cls)
 
@@ -24,6 +32,8 @@ class AbstractDataclass(ABC):
 class VoxEntity(ABC):
     """An abstract base class for objects that directly represent an entity in VOX file format."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_vox_string(self) -> str:
         """Convert the object to its string representation in VOX file format."""
@@ -33,6 +43,8 @@ class VoxEntity(ABC):
 class Validateable(ABC):
     """An abstract base class for classes that require validation."""
 
+    __slots__ = ()
+
     @abstractmethod
     def validate(self):
         """
@@ -1,14 +1,17 @@
 """
 Classes that represent chart-related entities.
 """
+import bisect
 import itertools
 import logging
+import math
 
+from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass, field, InitVar
 from decimal import Decimal
 from fractions import Fraction
-from typing import Any
+from functools import cached_property
 
 from .base import (
     Validateable,
@@ -26,6 +29,7 @@ from .enums import (
     SegmentFlag,
     SpinType,
     TiltType,
+    SEGMENT_END_BIT,
 )
 from .filters import (
     AutoTabEntry,
@@ -53,11 +57,14 @@ __all__ = [
 TICKS_PER_BAR = 192
 """Number of ticks in a single 4/4 bar."""
 
+CHART_START = TimePoint()
+"""Time point for the start of the chart. Time points are immutable, so this is shared instead of recreated."""
+
 HALF_TICK_BPM_THRESHOLD = Decimal("255")
 """Threshold for the BPM at which the tick rate halves."""
 
-MIN_RADAR_VAL = Decimal()
-MAX_RADAR_VAL = Decimal("200")
+MIN_RADAR_VAL = 0.0
+MAX_RADAR_VAL = 200.0
 NOTE_STR_FLAG_MAP = {
     NoteType.FX_L: 0o40,
     NoteType.BT_A: 0o20,
@@ -67,61 +74,92 @@ NOTE_STR_FLAG_MAP = {
     NoteType.FX_R: 0o01,
 }
 # fmt: off
-SPIN_TYPE_MAP: dict[SpinType, tuple[Decimal, int]] = {
-    SpinType.NO_SPIN      : (Decimal("0.0"),   0),
-    SpinType.SINGLE_SPIN  : (Decimal("1.1"), 152),
-    SpinType.SINGLE_SPIN_2: (Decimal("0.7"), 104),
-    SpinType.SINGLE_SPIN_3: (Decimal("0.9"), 128),
-    SpinType.TRIPLE_SPIN  : (Decimal("3.0"), 392),
-    SpinType.HALF_SPIN    : (Decimal("0.5"), 128),
+SPIN_TYPE_MAP: dict[SpinType, tuple[float, int]] = {
+    SpinType.NO_SPIN      : (0.0,   0),
+    SpinType.SINGLE_SPIN  : (1.1, 152),
+    SpinType.SINGLE_SPIN_2: (0.7, 104),
+    SpinType.SINGLE_SPIN_3: (0.9, 128),
+    SpinType.TRIPLE_SPIN  : (3.0, 392),
+    SpinType.HALF_SPIN    : (0.5, 128),
 }
 # fmt: on
 ONEHAND_CHIPS_MAP = {
-    0: Decimal(),
-    1: Decimal("1.2132"),
-    2: Decimal("1.3343"),
-    3: Decimal("1.6246"),
+    0: 0.0,
+    1: 1.2132,
+    2: 1.3343,
+    3: 1.6246,
 }
-ONEHAND_CHIPS_DEFAULT = Decimal("1.6365")
+ONEHAND_CHIPS_DEFAULT = 1.6365
 ONEHAND_HOLDS_MAP = {
-    0: Decimal(),
-    1: Decimal("0.2205"),
-    2: Decimal("0.3530"),
-    3: Decimal("0.5180"),
+    0: 0.0,
+    1: 0.2205,
+    2: 0.3530,
+    3: 0.5180,
 }
-ONEHAND_HOLDS_DEFAULT = Decimal("0.5649")
+ONEHAND_HOLDS_DEFAULT = 0.5649
 HANDTRIP_VALUE_MAP = {
-    0: Decimal(),
-    1: Decimal("1.2486"),
-    2: Decimal("1.4250"),
-    3: Decimal("1.5113"),
+    0: 0.0,
+    1: 1.2486,
+    2: 1.4250,
+    3: 1.5113,
 }
-HANDTRIP_NOTETYPES_MAP = {
-    NoteType.VOL_L: {NoteType.BT_A, NoteType.BT_B, NoteType.FX_L},
-    NoteType.VOL_R: {NoteType.BT_C, NoteType.BT_D, NoteType.FX_R},
+HANDTRIP_FLAG_MAP = {
+    NoteType.VOL_L: 0o70,
+    NoteType.VOL_R: 0o07,
 }
-TRICKY_CAM_FLAT_INC = Decimal("0.103")
-TRICKY_JACK_DISTANCE = Decimal("15") / 130
+"""Combined flags (from `NOTE_STR_FLAG_MAP`) of the buttons played by the hand on the other side of each laser."""
+TRICKY_CAM_FLAT_INC = 0.103
+TRICKY_JACK_DISTANCE = 15 / 130
 """Distance (in seconds) between two consecutive 1/16ths at 130bpm."""
+ELAPSED_TIME_TOLERANCE = 1e-9
+"""Tolerance (in seconds) when comparing elapsed times, which are subject to rounding errors."""
+
+
+def _calculate_peak_value(flags: int) -> float:
+    """Calculate the peak value of simultaneous notes, given their combined flags from `NOTE_STR_FLAG_MAP`."""
+    peak_value = 0.0
+    # Decrease peak value when certain chords happen
+    # LAB chord
+    if flags & 0o70 == 0o70:
+        peak_value -= 1.5
+    # 2-button chord of L, A, B
+    elif any(flags & mask == mask for mask in [0o60, 0o50, 0o30]):
+        peak_value -= 0.83
+    # CDR chord
+    if flags & 0o07 == 0o07:
+        peak_value -= 1.5
+    # 2-button chord of C, D, R
+    elif any(flags & mask == mask for mask in [0o06, 0o05, 0o03]):
+        peak_value -= 0.83
+    # Only applies for exactly a BC chord
+    if flags == 0o14:
+        peak_value -= 0.83
+    # Increase peak value by 1 for each note
+    while flags:
+        peak_value += flags % 2
+        flags //= 2
+    return peak_value
+
+
+PEAK_VALUES = tuple(_calculate_peak_value(flags) for flags in range(0o100))
+"""Peak value of a moment in the chart, indexed by the combined flags of the notes at that moment."""
+
+SEGMENT_ENDPOINT_FLAGS = (SegmentFlag.START, SegmentFlag.END)
+"""Point types of segment endpoints that are not also a single-point segment."""
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BTInfo(Validateable):
-    """A class that represents a BT object."""
+    """An immutable class that represents a BT object."""
 
     _duration: InitVar[Fraction | int]
     duration: Fraction = field(init=False)
 
-    def _setattrhook(self, __name: str, __value: Any):
-        super().__setattr__(__name, __value)
-        self.validate()
-
     def __post_init__(self, _duration):
-        self.duration = Fraction(_duration)
+        object.__setattr__(self, "duration", Fraction(_duration))
         self.validate()
-        self.__setattr__ = self._setattrhook
 
     def validate(self):
         if self.duration < 0:
@@ -132,22 +170,17 @@ class BTInfo(Validateable):
         return round(TICKS_PER_BAR * self.duration)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FXInfo(Validateable):
-    """A class that represents an FX object."""
+    """An immutable class that represents an FX object."""
 
     _duration: InitVar[Fraction | int]
     duration: Fraction = field(init=False)
     special: int
 
-    def _setattrhook(self, __name: str, __value: Any):
-        super().__setattr__(__name, __value)
-        self.validate()
-
     def __post_init__(self, _duration):
-        self.duration = Fraction(_duration)
+        object.__setattr__(self, "duration", Fraction(_duration))
         self.validate()
-        self.__setattr__ = self._setattrhook
 
     def validate(self):
         if self.duration < 0:
@@ -160,7 +193,7 @@ class FXInfo(Validateable):
         return round(TICKS_PER_BAR * self.duration)
 
 
-@dataclass
+@dataclass(slots=True)
 class VolInfo(Validateable):
     """A class that represents a singular point on a VOL segment."""
 
@@ -174,13 +207,8 @@ class VolInfo(Validateable):
     wide_laser: bool = False
     interpolated: bool = False
 
-    def _setattrhook(self, __name: str, __value: Any):
-        super().__setattr__(__name, __value)
-        self.validate()
-
     def __post_init__(self):
         self.validate()
-        self.__setattr__ = self._setattrhook
 
     def validate(self):
         if not 0 <= self.start <= 1:
@@ -255,7 +283,7 @@ class NoteData:
             (NoteType.VOL_R, self.vol_r),
         ]
         is_empty_loop = True
-        key, value = TimePoint(), VolInfo(Fraction(), Fraction())
+        key, value = CHART_START, VolInfo(Fraction(), Fraction())
         for note_type, note_dict in dicts:
             for key, value in note_dict.items():
                 is_empty_loop = False
@@ -280,6 +308,28 @@ class NoteData:
             for key, value in note_dict.items():
                 yield note_type, key, value
 
+    def get_button_lanes(self) -> list[tuple[NoteType, list[TimePoint], list[Fraction]]]:
+        """
+        Get every BT and FX object as parallel lists, one entry per lane.
+
+        This is intended for hot loops that only need the time points and durations of the notes.
+
+        :returns: A list of 3-tuples of: note type, time points of the lane's notes, and durations of the lane's notes.
+            Both lists are in the same order.
+        """
+        dicts: list[tuple[NoteType, dict[TimePoint, BTInfo] | dict[TimePoint, FXInfo]]] = [
+            (NoteType.BT_A, self.bt_a),
+            (NoteType.BT_B, self.bt_b),
+            (NoteType.BT_C, self.bt_c),
+            (NoteType.BT_D, self.bt_d),
+            (NoteType.FX_L, self.fx_l),
+            (NoteType.FX_R, self.fx_r),
+        ]
+        return [
+            (note_type, list(note_dict.keys()), [note.duration for note in note_dict.values()])
+            for note_type, note_dict in dicts
+        ]
+
     def iter_notes(self) -> Iterable[tuple[NoteType, TimePoint, BTInfo | FXInfo | VolInfo]]:
         """
         Iterate through every note object and VOL point.
@@ -302,7 +352,7 @@ class NoteData:
                 yield note_type, key, value
 
 
-@dataclass
+@dataclass(slots=True)
 class SPControllerInfo:
     """A class that represents a value of a SPController parameter."""
 
@@ -332,7 +382,7 @@ class SPControllerData:
     manual_bars: list[TimePoint] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoTabInfo:
     """A class for storing laser effect data."""
 
@@ -361,17 +411,6 @@ class ChartInfo:
     jacket_path: str = ""
     end_measure: int = 0
 
-    # Calculated data
-    _chip_notecount: int = -1
-    _long_notecount: int = -1
-    _vol_notecount: int = -1
-    _radar_notes: int = -1
-    _radar_peak: int = -1
-    _radar_tsumami: int = -1
-    _radar_onehand: int = -1
-    _radar_handtrip: int = -1
-    _radar_tricky: int = -1
-
     # Song data that may change mid-song
     bpms: dict[TimePoint, Decimal] = field(default_factory=dict)
     timesigs: dict[TimePoint, TimeSignature] = field(default_factory=dict)
@@ -401,25 +440,36 @@ class ChartInfo:
     _custom_filter: dict[str, Effect] = field(default_factory=dict, init=False, repr=False)
 
     # For radar calculation
-    _elapsed_time: dict[TimePoint, Decimal] = field(default_factory=dict, init=False, repr=False)
-    _elapsed_time_bpm: dict[TimePoint, Decimal] = field(default_factory=dict, init=False, repr=False)
-    _bpm_durations: dict[Decimal, Decimal] = field(default_factory=dict, init=False, repr=False)
+    # Elapsed time is kept as floats, since this is only used for radar values and doesn't need to be exact
+    _elapsed_time: dict[TimePoint, float] = field(default_factory=dict, init=False, repr=False)
+    # BPM changes as parallel lists, keyed by position rather than by time point
+    _bpm_change_positions: list[Fraction] = field(default_factory=list, init=False, repr=False)
+    _bpm_change_times: list[float] = field(default_factory=list, init=False, repr=False)
+    _bpm_change_values: list[Decimal] = field(default_factory=list, init=False, repr=False)
+    _bpm_durations: dict[Decimal, float] = field(default_factory=dict, init=False, repr=False)
 
     # Cached values
     _timesig_cache: dict[int, TimeSignature] = field(default_factory=dict, init=False, repr=False)
     _bpm_cache: dict[TimePoint, Decimal] = field(default_factory=dict, init=False, repr=False)
     _tickrate_cache: dict[TimePoint, Fraction] = field(default_factory=dict, init=False, repr=False)
     _time_to_frac_cache: dict[TimePoint, Fraction] = field(default_factory=dict, init=False, repr=False)
+    _timesig_keys: list[TimePoint] = field(default_factory=list, init=False, repr=False)
+    _timesig_measures: list[int] = field(default_factory=list, init=False, repr=False)
+    # Position of the start of each measure, starting from the first measure
+    _measure_starts: list[Fraction] = field(default_factory=lambda: [Fraction()], init=False, repr=False)
+    _bpm_keys: list[TimePoint] = field(default_factory=list, init=False, repr=False)
+    _tick_rate_starts: list[Fraction] = field(default_factory=list, init=False, repr=False)
+    _tick_rates: list[Fraction] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self):
         # Default values
-        self.bpms[TimePoint()] = Decimal("120")
-        self.timesigs[TimePoint()] = TimeSignature()
-        self.tilt_type[TimePoint()] = TiltType.NORMAL
-        self.active_filter[TimePoint()] = FilterIndex.PEAK
+        self.bpms[CHART_START] = Decimal("120")
+        self.timesigs[CHART_START] = TimeSignature()
+        self.tilt_type[CHART_START] = TiltType.NORMAL
+        self.active_filter[CHART_START] = FilterIndex.PEAK
 
-        self.spcontroller_data.zoom_bottom[TimePoint()] = SPControllerInfo(Decimal(), Decimal())
-        self.spcontroller_data.zoom_top[TimePoint()] = SPControllerInfo(Decimal(), Decimal())
+        self.spcontroller_data.zoom_bottom[CHART_START] = SPControllerInfo(Decimal(), Decimal())
+        self.spcontroller_data.zoom_top[CHART_START] = SPControllerInfo(Decimal(), Decimal())
 
         # Populate filter list
         self.filter_list = get_default_filters()
@@ -437,104 +487,165 @@ class ChartInfo:
 
         This is called automatically when getting the note counts for the first time.
         """
-        self._chip_notecount = 0
-        self._long_notecount = 0
-        self._vol_notecount = 0
+        chip_notecount = 0
+        long_notecount = 0
+        vol_notecount = 0
+        # Skip formatting the log messages if they won't be shown
+        log_debug = logger.isEnabledFor(logging.DEBUG)
 
         # Chip and long notes
-        for note_type, timept, note in self.note_data.iter_buttons():
-            if note.duration == 0:
-                self._chip_notecount += 1
-            else:
-                tick_rate = self.get_tick_rate(timept)
-                tick_start = self.timepoint_to_fraction(timept)
-                hold_end = self.add_duration(timept, note.duration)
-                cur_hold_ticks = 0
-                # Round up to next tick
-                if tick_start % tick_rate != 0:
-                    cur_hold_ticks += 1
-                    timept = self.add_duration(timept, tick_rate - (tick_start % tick_rate))
-                # Add ticks
-                while timept < hold_end:
-                    cur_hold_ticks += 1
-                    tick_rate = self.get_tick_rate(timept)
-                    timept = self.add_duration(timept, tick_rate)
-                # Long enough holds become lenient at the end
-                if cur_hold_ticks > 5:
-                    cur_hold_ticks -= 1
-                if cur_hold_ticks > 6:
-                    cur_hold_ticks -= 1
-                self._long_notecount += cur_hold_ticks
+        holds: list[tuple[TimePoint, Fraction]] = []
+        for _, timepts, durations in self.note_data.get_button_lanes():
+            for timept, duration in zip(timepts, durations):
+                if duration == 0:
+                    chip_notecount += 1
+                else:
+                    holds.append((timept, duration))
+        for timept, duration in holds:
+            tick_rate = self.get_tick_rate(timept)
+            tick_start = self.timepoint_to_fraction(timept)
+            hold_end = tick_start + duration
+            cur_hold_ticks = 0
+            # Round up to next tick
+            if tick_start % tick_rate != 0:
+                cur_hold_ticks += 1
+                tick_start += tick_rate - (tick_start % tick_rate)
+            # Add ticks
+            cur_hold_ticks += self._count_ticks(tick_start, hold_end)
+            # Long enough holds become lenient at the end
+            if cur_hold_ticks > 5:
+                cur_hold_ticks -= 1
+            if cur_hold_ticks > 6:
+                cur_hold_ticks -= 1
+            long_notecount += cur_hold_ticks
 
         # Lasers
         cur_note_type: NoteType | None = None
         cur_note_type = NoteType.DUMMY
-        laser_start, laser_end = TimePoint(), TimePoint()
+        laser_start, laser_end = CHART_START, CHART_START
         slam_locations: list[TimePoint] = []
         for note_type, timept, laser in self.note_data.iter_vols():
             # Reset state variables when changing tracks
             if note_type != cur_note_type:
                 cur_note_type = note_type
-                laser_start, laser_end = TimePoint(), TimePoint()
+                laser_start, laser_end = CHART_START, CHART_START
                 slam_locations: list[TimePoint] = []
+            point_type = laser.point_type
             # This really should only be slams
-            if laser.point_type == SegmentFlag.POINT:
-                self._vol_notecount += 1
-            elif laser.point_type in [SegmentFlag.START, SegmentFlag.END]:
+            if point_type == SegmentFlag.POINT:
+                vol_notecount += 1
+            elif point_type in SEGMENT_ENDPOINT_FLAGS:
                 if laser.start != laser.end:
                     slam_locations.append(timept)
-                if laser.point_type == SegmentFlag.START:
+                if point_type == SegmentFlag.START:
                     laser_start = timept
-                elif laser.point_type == SegmentFlag.END:
+                elif point_type == SegmentFlag.END:
                     laser_end = timept
-                    logger.debug(
-                        f"laser segment: {self.timepoint_to_vox(laser_start)} => {self.timepoint_to_vox(laser_end)}"
-                    )
+                    if log_debug:
+                        logger.debug(
+                            f"laser segment: {self.timepoint_to_vox(laser_start)} => {self.timepoint_to_vox(laser_end)}"
+                        )
                     # Process ticks
+                    # Work with positions from the start of the chart, so that stepping through ticks doesn't
+                    # need to construct time points
                     tick_rate = self.get_tick_rate(laser_start)
                     tick_start = self.timepoint_to_fraction(laser_start)
+                    tick_end = self.timepoint_to_fraction(laser_end)
                     # Round up to next tick
                     if tick_start % tick_rate != 0:
-                        laser_start = self.add_duration(laser_start, tick_rate - (tick_start % tick_rate))
-                    timept = laser_start
+                        tick_start += tick_rate - (tick_start % tick_rate)
                     # Get tick locations
-                    tick_locations: dict[TimePoint, bool] = {}
-                    tick_keys: list[TimePoint] = []
-                    while timept < laser_end:
-                        tick_locations[timept] = True
-                        tick_keys.append(timept)
-                        tick_rate = self.get_tick_rate(timept)
-                        timept = self.add_duration(timept, tick_rate)
+                    tick_keys: list[Fraction] = []
+                    while tick_start < tick_end:
+                        tick_keys.append(tick_start)
+                        tick_start += self._get_tick_rate_at(tick_start)
+                    tick_enabled = [True] * len(tick_keys)
                     # Mark ticks as "occupied" by slams
-                    tick_index = -1
-                    for slam in slam_locations:
+                    for slam_timept in slam_locations:
                         if not tick_keys:
                             break
-                        while tick_index < len(tick_keys) - 1 and tick_keys[tick_index + 1] < slam:
-                            tick_index += 1
+                        slam = self.timepoint_to_fraction(slam_timept)
+                        # Index of the last tick before the slam
+                        tick_index = bisect.bisect_left(tick_keys, slam) - 1
                         if tick_index == -1:
-                            tick_locations[tick_keys[0]] = False
+                            tick_enabled[0] = False
                         elif tick_index == len(tick_keys) - 1:
-                            tick_rate = self.get_tick_rate(tick_keys[tick_index])
-                            next_tick_timept = self.add_duration(tick_keys[tick_index], tick_rate)
-                            if slam < next_tick_timept:
-                                tick_locations[tick_keys[tick_index]] = False
+                            tick_rate = self._get_tick_rate_at(tick_keys[tick_index])
+                            if slam < tick_keys[tick_index] + tick_rate:
+                                tick_enabled[tick_index] = False
                         else:
-                            tick_rate = self.get_tick_rate(tick_keys[tick_index])
-                            halfway_timept = self.add_duration(tick_keys[tick_index], tick_rate / 2)
-                            if slam <= halfway_timept:
-                                tick_locations[tick_keys[tick_index]] = False
-                            if slam >= halfway_timept:
-                                tick_locations[tick_keys[tick_index + 1]] = False
-                    disabled_ticks = [k for k, v in tick_locations.items() if not v]
-                    if disabled_ticks:
-                        logger.debug(f"disabled tick: {[self.timepoint_to_vox(t) for t in disabled_ticks]}")
-                    self._vol_notecount += len(slam_locations) + sum(tick_locations.values())
+                            tick_rate = self._get_tick_rate_at(tick_keys[tick_index])
+                            halfway_tick = tick_keys[tick_index] + tick_rate / 2
+                            if slam <= halfway_tick:
+                                tick_enabled[tick_index] = False
+                            if slam >= halfway_tick:
+                                tick_enabled[tick_index + 1] = False
+                    disabled_ticks = [t for t, enabled in zip(tick_keys, tick_enabled) if not enabled]
+                    if log_debug and disabled_ticks:
+                        logger.debug(
+                            "disabled tick: "
+                            f"{[self.timepoint_to_vox(self.add_duration(CHART_START, t)) for t in disabled_ticks]}"
+                        )
+                    vol_notecount += len(slam_locations) + sum(tick_enabled)
                     slam_locations = []
             else:
                 if laser.start != laser.end:
                     slam_locations.append(timept)
 
+        # Store the results in place of the cached properties, so that calling this again also refreshes them
+        self.__dict__.update(chip_notecount=chip_notecount, long_notecount=long_notecount, vol_notecount=vol_notecount)
+
+    def _populate_tick_rates(self) -> None:
+        """Collect the positions where the tick rate changes, if not done yet."""
+        if self._tick_rates:
+            return
+        # Only BPM changes that change the tick rate are relevant
+        for timept in self.bpms:
+            tick_rate = self.get_tick_rate(timept)
+            if not self._tick_rates or self._tick_rates[-1] != tick_rate:
+                self._tick_rate_starts.append(self.timepoint_to_fraction(timept))
+                self._tick_rates.append(tick_rate)
+
+    def _get_tick_rate_at(self, position: Fraction) -> Fraction:
+        """
+        Fetch the prevailing tick rate at the given position.
+
+        :param position: The position to query, as returned by
+            :meth:`~sdvxparser.classes.chart.ChartInfo.timepoint_to_fraction`.
+        :returns: The active tick rate at that position.
+        """
+        self._populate_tick_rates()
+        return self._tick_rates[bisect.bisect_right(self._tick_rate_starts, position) - 1]
+
+    def _count_ticks(self, tick_start: Fraction, tick_end: Fraction) -> int:
+        """
+        Count the ticks between two positions, where the first tick is at the starting position.
+
+        The tick rate is re-evaluated at every tick, so ticks may be spaced differently after a BPM change.
+
+        :param tick_start: The position of the first tick, as returned by
+            :meth:`~sdvxparser.classes.chart.ChartInfo.timepoint_to_fraction`.
+        :param tick_end: The position to stop at (exclusive).
+        :returns: The number of ticks.
+        """
+        self._populate_tick_rates()
+
+        tick_count = 0
+        index = bisect.bisect_right(self._tick_rate_starts, tick_start) - 1
+        while tick_start < tick_end:
+            index = bisect.bisect_right(self._tick_rate_starts, tick_start, lo=index) - 1
+            tick_rate = self._tick_rates[index]
+            # Ticks within the same tick rate are evenly spaced, so skip to the first tick past this section
+            if index + 1 < len(self._tick_rate_starts):
+                section_end = min(self._tick_rate_starts[index + 1], tick_end)
+            else:
+                section_end = tick_end
+            section_ticks = math.ceil((section_end - tick_start) / tick_rate)
+            tick_count += section_ticks
+            tick_start += section_ticks * tick_rate
+
+        return tick_count
+
     # Figure out how long each particular BPM lasts
     # Helpful to figure out time elapsed for a particular note
     def _calculate_bpm_durations(self, endpoint: TimePoint) -> None:
@@ -545,42 +656,51 @@ class ChartInfo:
 
         :param endpoint: The time point for the end of the chart.
         """
-        running_total = Decimal()
+        self._bpm_durations.clear()
+        self._bpm_change_positions.clear()
+        self._bpm_change_times.clear()
+        self._bpm_change_values.clear()
+
+        running_total = 0.0
         for timept_i, timept_f in itertools.pairwise([*self.bpms.keys(), endpoint]):
             # First BPM point should be at 001,01,00, which means elapsed time is 0 sec.
-            if not self._elapsed_time_bpm:
-                self._elapsed_time_bpm[timept_i] = Decimal()
+            if not self._bpm_change_positions:
+                self._bpm_change_positions.append(self.timepoint_to_fraction(timept_i))
+                self._bpm_change_times.append(0.0)
+                self._bpm_change_values.append(self.bpms[timept_i])
             cur_bpm = self.bpms[timept_i]
             # Distance is in fractions of 4 beats -- i.e. 1 distance = 4 beats
-            bpm_distance = self.get_distance(timept_i, timept_f)
+            # Absolute positions are cached, so this avoids walking through every measure in between
+            bpm_distance = self.timepoint_to_fraction(timept_f) - self.timepoint_to_fraction(timept_i)
             # Inverse of BPM is in minutes/beat
             # Multiply that with distance to get duration in minutes
             # So we need to multiply with 60 sec/min
             # tl;dr: 1 / bpm (min/beat) * 60 (sec/min) * distance (dist) * 4 (beats/dist)
-            bpm_duration = 1 / cur_bpm * 4 * 60 * bpm_distance.numerator / bpm_distance.denominator
+            bpm_duration = 240 * bpm_distance.numerator / bpm_distance.denominator / float(cur_bpm)
             if cur_bpm not in self._bpm_durations:
-                self._bpm_durations[cur_bpm] = Decimal()
+                self._bpm_durations[cur_bpm] = 0.0
             self._bpm_durations[cur_bpm] += bpm_duration
             running_total += bpm_duration
-            self._elapsed_time_bpm[timept_f] = running_total
+            # The chart may end before the last BPM change, which would leave the lists unsorted
+            position_f = self.timepoint_to_fraction(timept_f)
+            if position_f >= self._bpm_change_positions[-1]:
+                self._bpm_change_positions.append(position_f)
+                self._bpm_change_times.append(running_total)
+                self._bpm_change_values.append(self.get_bpm(timept_f))
 
-        self._elapsed_time = dict(self._elapsed_time_bpm)
+        self._elapsed_time = {}
 
-    def _get_elapsed_time(self, timept: TimePoint) -> Decimal:
+    def _get_elapsed_time(self, timept: TimePoint) -> float:
         """Convert timepoint into seconds."""
         if timept not in self._elapsed_time:
-            prev_elapsed_time = Decimal()
-            prev_timept = TimePoint()
-            for cur_timept, elapsed_time in self._elapsed_time.items():
-                if cur_timept > timept:
-                    break
-                prev_elapsed_time = elapsed_time
-                prev_timept = cur_timept
+            position = self.timepoint_to_fraction(timept)
+            # Last BPM change at or before this position
+            index = max(bisect.bisect_right(self._bpm_change_positions, position) - 1, 0)
             # Similar calculation as in _populate_bpm_durations
-            cur_bpm = self.get_bpm(prev_timept)
-            note_distance_frac = self.get_distance(timept, prev_timept)
-            note_distance = 1 / cur_bpm * 4 * 60 * note_distance_frac.numerator / note_distance_frac.denominator
-            self._elapsed_time[timept] = prev_elapsed_time + note_distance
+            cur_bpm = self._bpm_change_values[index]
+            note_distance_frac = position - self._bpm_change_positions[index]
+            note_distance = 240 * note_distance_frac.numerator / note_distance_frac.denominator / float(cur_bpm)
+            self._elapsed_time[timept] = self._bpm_change_times[index] + note_distance
 
         return self._elapsed_time[timept]
 
@@ -592,16 +712,13 @@ class ChartInfo:
 
         This is called automatically when getting the radar values for the first time.
         """
-        self._radar_notes = 0
-        self._radar_peak = 0
-        self._radar_tsumami = 0
-        self._radar_onehand = 0
-        self._radar_handtrip = 0
-        self._radar_tricky = 0
+        # Skip formatting the log messages if they won't be shown
+        log_info = logger.isEnabledFor(logging.INFO)
+        log_debug = logger.isEnabledFor(logging.DEBUG)
 
         # Figure out start/endpoint
         chart_begin_timept: TimePoint | None = None
-        chart_end_timept: TimePoint = TimePoint()
+        chart_end_timept: TimePoint = CHART_START
         for _, timept, note in self.note_data.iter_notes():
             if chart_begin_timept is None:
                 chart_begin_timept = timept
@@ -612,123 +729,125 @@ class ChartInfo:
                 end_timept = self.add_duration(timept, note.duration)
             chart_end_timept = max(end_timept, chart_end_timept)
         if chart_begin_timept is None:
-            chart_begin_timept = TimePoint()
+            chart_begin_timept = CHART_START
 
         # Figure out the BPM the hi-speed setting is tuned to
         self._calculate_bpm_durations(chart_end_timept)
-        standard_bpm = sorted(list(self._bpm_durations.items()), key=lambda t: (t[1], t[0]))[-1][0]
-        logger.info(f"----- GENERAL INFO -----")
-        logger.info(f"standard bpm: {standard_bpm:.2f}bpm")
-        for bpm, duration in self._bpm_durations.items():
-            logger.info(f"bpm duration: {bpm:.2f}bpm, {duration:.3f}s")
+        standard_bpm = max(self._bpm_durations.items(), key=lambda t: (t[1], t[0]))[0]
+        if log_info:
+            logger.info(f"----- GENERAL INFO -----")
+            logger.info(f"standard bpm: {standard_bpm:.2f}bpm")
+            for bpm, duration in self._bpm_durations.items():
+                logger.info(f"bpm duration: {bpm:.2f}bpm, {duration:.3f}s")
 
         # Calculate chart length
         chart_begin_time = self._get_elapsed_time(chart_begin_timept)
         chart_end_time = self._get_elapsed_time(chart_end_timept)
         total_chart_time = chart_end_time - chart_begin_time
         # Used to scale certain radar values inversely to song length
-        time_coefficient = total_chart_time / Decimal("118.5")
-        time_coefficient = clamp(time_coefficient, Decimal("1"))
-        logger.info(
-            f"chart span: {self.timepoint_to_vox(chart_begin_timept)} ~ {self.timepoint_to_vox(chart_end_timept)}"
-        )
-        logger.info(f"chart span: {chart_begin_time:.3f}s ~ {chart_end_time:.3f}s ({total_chart_time:.3f}s)")
+        time_coefficient = total_chart_time / 118.5
+        time_coefficient = clamp(time_coefficient, 1.0)
+        if log_info:
+            logger.info(
+                f"chart span: {self.timepoint_to_vox(chart_begin_timept)} ~ {self.timepoint_to_vox(chart_end_timept)}"
+            )
+            logger.info(f"chart span: {chart_begin_time:.3f}s ~ {chart_end_time:.3f}s ({total_chart_time:.3f}s)")
+
+        # Collected once, as every radar value below goes through the buttons
+        button_lanes = self.note_data.get_button_lanes()
 
         # Notes + Peak
         # Higher average NPS = higher "notes" value
         # Higher peak density (over 2 seconds) = higher "peak" value
-        peak_flags: dict[Decimal, int] = {}
+        peak_flags: defaultdict[float, int] = defaultdict(int)
         button_count = 0
-        for note_type, timept, _ in self.note_data.iter_buttons():
-            button_count += 1
-            # Figure out the time this particular note happens
-            note_timing = self._get_elapsed_time(timept)
-            if note_timing not in peak_flags:
-                peak_flags[note_timing] = 0
-            peak_flags[note_timing] += NOTE_STR_FLAG_MAP[note_type]
-
-        peak_values: dict[Decimal, Decimal] = {}
+        for note_type, timepts, _ in button_lanes:
+            # Every note in a lane has the same flag, so only look it up once
+            note_flag = NOTE_STR_FLAG_MAP[note_type]
+            button_count += len(timepts)
+            for timept in timepts:
+                # Figure out the time this particular note happens
+                # Each lane has its own bit, so this is equivalent to adding them up
+                peak_flags[self._get_elapsed_time(timept)] |= note_flag
+
+        peak_values: dict[float, float] = {}
         for note_timing, flags in sorted(peak_flags.items()):
-            peak_value = Decimal()
-            # Decrease peak value when certain chords happen
-            # LAB chord
-            if flags & 0o70 == 0o70:
-                peak_value -= Decimal("1.5")
-            # 2-button chord of L, A, B
-            elif any(flags & mask == mask for mask in [0o60, 0o50, 0o30]):
-                peak_value -= Decimal("0.83")
-            # CDR chord
-            if flags & 0o07 == 0o07:
-                peak_value -= Decimal("1.5")
-            # 2-button chord of C, D, R
-            elif any(flags & mask == mask for mask in [0o06, 0o05, 0o03]):
-                peak_value -= Decimal("0.83")
-            # Only applies for exactly a BC chord
-            if flags == 0o14:
-                peak_value -= Decimal("0.83")
-            # Increase peak value by 1 for each note
-            while flags:
-                peak_value += flags % 2
-                flags //= 2
-            peak_values[note_timing] = peak_value
+            peak_values[note_timing] = PEAK_VALUES[flags]
 
         # Calculate "notes" value
         # Number of chips + number of holds (not the chain from holds)
         # All these values are gonna have some adjustment coefficient that's obtained experimentally (oof)
-        logger.info("----- NOTES INFO -----")
-        logger.info(f"keypress count: {button_count}")
-        notes_value = button_count * 200 / Decimal("12.521") / total_chart_time
-        self._radar_notes = int(clamp(notes_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+        if log_info:
+            logger.info("----- NOTES INFO -----")
+            logger.info(f"keypress count: {button_count}")
+        notes_value = button_count * 200 / 12.521 / total_chart_time
+        radar_notes = int(clamp(notes_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
 
         # Calculate "peak" value
         # Sum peak values over a range of 2 seconds
         # Doing it twice -- once when note is at the start of the 2sec window, once at the end
-        ranged_peak_values = [
-            (tn, sum((v for tr, v in peak_values.items() if 0 <= (tr - tn) <= 2), Decimal()))
-            for tn in peak_values.keys()
-        ]
-        ranged_peak_values += [
-            (tn, sum((v for tr, v in peak_values.items() if 0 <= (tn - tr) <= 2), Decimal()))
-            for tn in peak_values.keys()
-        ]
-        peak_value = Decimal()
-        peak_time = Decimal()
+        # Note timings are sorted, so the window bounds only ever move forward
+        note_timings = list(peak_values.keys())
+        note_peak_values = list(peak_values.values())
+        ranged_peak_values: list[tuple[float, float]] = []
+        window_end = 0
+        for index, tn in enumerate(note_timings):
+            while window_end < len(note_timings) and note_timings[window_end] - tn <= 2:
+                window_end += 1
+            ranged_peak_values.append((tn, sum(note_peak_values[index:window_end], 0.0)))
+        window_start = 0
+        for index, tn in enumerate(note_timings):
+            while tn - note_timings[window_start] > 2:
+                window_start += 1
+            ranged_peak_values.append((tn, sum(note_peak_values[window_start : index + 1], 0.0)))
+        peak_value = 0.0
+        peak_time = 0.0
         for t, v in ranged_peak_values:
             if v > peak_value:
                 peak_value = v
                 peak_time = t
-        logger.info(f"----- PEAK INFO -----")
-        logger.info(f"peak value at {peak_time:.3f}s: {peak_value:.2f}")
-        peak_value /= Decimal("0.24")
-        self._radar_peak = int(clamp(peak_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+        if log_info:
+            logger.info(f"----- PEAK INFO -----")
+            logger.info(f"peak value at {peak_time:.3f}s: {peak_value:.2f}")
+        peak_value /= 0.24
+        radar_peak = int(clamp(peak_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
 
         # Tsumami
         # More lasers = higher radar value
-        moving_laser_time = Decimal()
-        static_laser_time = Decimal()
-        slam_laser_time = Decimal()
+        moving_laser_time = 0.0
+        static_laser_time = 0.0
+        slam_laser_time = 0.0
         pre_laser_ranges: list[tuple[NoteType, TimePoint, TimePoint]] = []
-        for vol_tuple_i, vol_tuple_f in itertools.pairwise(self.note_data.iter_vols(add_dummy=True)):
-            note_type_i, timept_i, vol_data_i = vol_tuple_i
-            note_type_f, timept_f, vol_data_f = vol_tuple_f
-            # Add slam first before skipping
-            if vol_data_i.start != vol_data_i.end:
-                slam_laser_time += Decimal("0.11")
-                pre_laser_ranges.append((note_type_i, timept_i, timept_i))
-            # Skip if different tracks
-            if note_type_i != note_type_f:
-                continue
-            # Skip if these segments aren't connected
-            if SegmentFlag.END in vol_data_i.point_type:
-                continue
-            # Figure out laser duration otherwise
-            vol_duration = self._get_elapsed_time(timept_f) - self._get_elapsed_time(timept_i)
-            logger.debug(f"vol duration at {timept_i}: {vol_duration:.3f}s")
-            if vol_data_i.end != vol_data_f.start:
-                moving_laser_time += vol_duration
-                pre_laser_ranges.append((note_type_i, timept_i, timept_f))
-            else:
-                static_laser_time += vol_duration
+        vol_dicts: list[tuple[NoteType, dict[TimePoint, VolInfo]]] = [
+            (NoteType.VOL_L, self.note_data.vol_l),
+            (NoteType.VOL_R, self.note_data.vol_r),
+        ]
+        for vol_note_type, vol_dict in vol_dicts:
+            vol_timepts = list(vol_dict.keys())
+            vol_points = list(vol_dict.values())
+            for index, timept_i in enumerate(vol_timepts):
+                vol_data_i = vol_points[index]
+                # Add slam first before skipping
+                if vol_data_i.start != vol_data_i.end:
+                    slam_laser_time += 0.11
+                    pre_laser_ranges.append((vol_note_type, timept_i, timept_i))
+                # Skip the last point of the track
+                if index + 1 == len(vol_timepts):
+                    continue
+                # Skip if these segments aren't connected
+                if vol_data_i.point_type.value & SEGMENT_END_BIT:
+                    continue
+                timept_f = vol_timepts[index + 1]
+                vol_data_f = vol_points[index + 1]
+                # Figure out laser duration otherwise
+                vol_duration = self._get_elapsed_time(timept_f) - self._get_elapsed_time(timept_i)
+                if log_debug:
+                    logger.debug(f"vol duration at {timept_i}: {vol_duration:.3f}s")
+                if vol_data_i.end != vol_data_f.start:
+                    moving_laser_time += vol_duration
+                    pre_laser_ranges.append((vol_note_type, timept_i, timept_f))
+                else:
+                    static_laser_time += vol_duration
         # Merge coincident endpoints
         laser_ranges: list[tuple[NoteType, TimePoint, TimePoint]] = []
         prev_info: tuple[NoteType, TimePoint, TimePoint] | None = None
@@ -744,80 +863,110 @@ class ChartInfo:
             prev_info = note_type, timept_i, timept_f
         if prev_info is not None:
             laser_ranges.append(prev_info)
-        logger.info(f"----- TSUMAMI INFO -----")
-        logger.info(f"moving laser time: {moving_laser_time:.3f}s")
-        logger.info(f"static laser time: {static_laser_time:.3f}s")
-        logger.info(f"slam laser time: {slam_laser_time:.3f}s")
+        if log_info:
+            logger.info(f"----- TSUMAMI INFO -----")
+            logger.info(f"moving laser time: {moving_laser_time:.3f}s")
+            logger.info(f"static laser time: {static_laser_time:.3f}s")
+            logger.info(f"slam laser time: {slam_laser_time:.3f}s")
         tsumami_value = (moving_laser_time + slam_laser_time) / total_chart_time * 191
         tsumami_value += static_laser_time / total_chart_time * 29
-        tsumami_value *= Decimal("0.956")
-        self._radar_tsumami = int(clamp(tsumami_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+        tsumami_value *= 0.956
+        radar_tsumami = int(clamp(tsumami_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
 
         # One-hand + Hand-trip
         # More buttons while laser movement happens = higher "one-hand" value
         # More opposite side buttons while one-handing = higher "hand-trip" value
         onehand = {
-            "chip": Decimal(),
-            "long": Decimal(),
+            "chip": 0.0,
+            "long": 0.0,
         }
         handtrip = {
-            "chip": Decimal(),
-            "long": Decimal(),
+            "chip": 0.0,
+            "long": 0.0,
         }
-        for laser_note_type, timept_i, timept_f in laser_ranges:
-            # One-hand check
-            chip_timepts: dict[TimePoint, list[NoteType]] = {}
+        # Charts without laser segments have nothing to check
+        if laser_ranges:
+            # Every hold is checked against every laser segment, so collect them once
+            # With sorted start and end points, the number of holds active at a time point is the number of holds that
+            # have started minus the number of holds that have ended
             hold_timepts: list[tuple[NoteType, TimePoint, TimePoint]] = []
-            for note_type, btn_timept_i, note_data in self.note_data.iter_buttons():
-                if timept_i <= btn_timept_i <= timept_f:
-                    if btn_timept_i not in chip_timepts:
-                        chip_timepts[btn_timept_i] = []
-                    chip_timepts[btn_timept_i].append(note_type)
-                if note_data.duration != 0:
-                    btn_timept_f = self.add_duration(btn_timept_i, note_data.duration)
-                    # Hold happens at least partially within the laser segment
-                    if btn_timept_i <= timept_f or timept_i <= btn_timept_f:
-                        hold_timepts.append((note_type, btn_timept_i, btn_timept_f))
-            timept_check = {t for _, t, _ in hold_timepts if timept_i <= t <= timept_f}
-            timept_check.add(timept_i)
-            for note_list in chip_timepts.values():
-                onehand_count = len(note_list)
-                handtrip_count = sum(1 for nt in note_list if nt in HANDTRIP_NOTETYPES_MAP[laser_note_type])
-                onehand["chip"] += ONEHAND_CHIPS_MAP.get(onehand_count, ONEHAND_CHIPS_DEFAULT)
-                handtrip["chip"] += HANDTRIP_VALUE_MAP[handtrip_count]
-            for timept in timept_check:
-                # Count holds that are happening
-                onehand_count = sum(1 for _, ti, tf in hold_timepts if ti <= timept < tf)
-                handtrip_count = sum(
-                    1
-                    for nt, ti, tf in hold_timepts
-                    if ti <= timept < tf and nt in HANDTRIP_NOTETYPES_MAP[laser_note_type]
+            for note_type, timepts, durations in button_lanes:
+                for btn_timept_i, duration in zip(timepts, durations):
+                    if duration != 0:
+                        hold_timepts.append((note_type, btn_timept_i, self.add_duration(btn_timept_i, duration)))
+            hold_starts = sorted(ti for _, ti, _ in hold_timepts)
+            hold_ends = sorted(tf for _, _, tf in hold_timepts)
+            handtrip_hold_starts = {
+                laser_note_type: sorted(ti for nt, ti, _ in hold_timepts if NOTE_STR_FLAG_MAP[nt] & handtrip_flags)
+                for laser_note_type, handtrip_flags in HANDTRIP_FLAG_MAP.items()
+            }
+            handtrip_hold_ends = {
+                laser_note_type: sorted(tf for nt, _, tf in hold_timepts if NOTE_STR_FLAG_MAP[nt] & handtrip_flags)
+                for laser_note_type, handtrip_flags in HANDTRIP_FLAG_MAP.items()
+            }
+            # Buttons are grouped by time point once, so the groups within a laser segment can be found by bisection
+            # Each lane has its own bit, so the number of set bits in a group is the number of notes
+            chip_timepts: list[TimePoint] = []
+            chip_flags: list[int] = []
+            button_flags = sorted(
+                (timept, NOTE_STR_FLAG_MAP[note_type]) for note_type, timepts, _ in button_lanes for timept in timepts
+            )
+            for timept, group in itertools.groupby(button_flags, key=lambda t: t[0]):
+                flags = 0
+                for _, note_flag in group:
+                    flags |= note_flag
+                chip_timepts.append(timept)
+                chip_flags.append(flags)
+            for laser_note_type, timept_i, timept_f in laser_ranges:
+                # One-hand check
+                handtrip_flags = HANDTRIP_FLAG_MAP[laser_note_type]
+                chip_start = bisect.bisect_left(chip_timepts, timept_i)
+                chip_end = bisect.bisect_right(chip_timepts, timept_f, lo=chip_start)
+                timept_check = set(
+                    hold_starts[bisect.bisect_left(hold_starts, timept_i) : bisect.bisect_right(hold_starts, timept_f)]
                 )
-                onehand["long"] += ONEHAND_HOLDS_MAP.get(onehand_count, ONEHAND_HOLDS_DEFAULT)
-                handtrip["long"] += HANDTRIP_VALUE_MAP[handtrip_count]
-        logger.info(f"----- ONE-HAND INFO -----")
-        logger.info(f'button tap value: {onehand["chip"]:.3f}')
-        logger.info(f'button hold value: {onehand["long"]:.3f}')
-        onehand_factor = (onehand["chip"] + onehand["long"]) / button_count - Decimal("0.16")
-        onehand_factor /= Decimal("0.34")
-        onehand_factor = clamp(onehand_factor, Decimal(), Decimal("1")) + 2
-        onehand_value = (onehand["chip"] + onehand["long"]) / Decimal("5.55") * onehand_factor / time_coefficient
-        self._radar_onehand = int(clamp(onehand_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
-        logger.info(f"----- HAND-TRIP INFO -----")
-        logger.info(f'button tap value: {handtrip["chip"]:.3f}')
-        logger.info(f'button hold value: {handtrip["long"]:.3f}')
+                timept_check.add(timept_i)
+                for flags in chip_flags[chip_start:chip_end]:
+                    onehand_count = flags.bit_count()
+                    handtrip_count = (flags & handtrip_flags).bit_count()
+                    onehand["chip"] += ONEHAND_CHIPS_MAP.get(onehand_count, ONEHAND_CHIPS_DEFAULT)
+                    handtrip["chip"] += HANDTRIP_VALUE_MAP[handtrip_count]
+                for timept in timept_check:
+                    # Count holds that are happening
+                    onehand_count = bisect.bisect_right(hold_starts, timept) - bisect.bisect_right(hold_ends, timept)
+                    handtrip_count = bisect.bisect_right(
+                        handtrip_hold_starts[laser_note_type], timept
+                    ) - bisect.bisect_right(handtrip_hold_ends[laser_note_type], timept)
+                    onehand["long"] += ONEHAND_HOLDS_MAP.get(onehand_count, ONEHAND_HOLDS_DEFAULT)
+                    handtrip["long"] += HANDTRIP_VALUE_MAP[handtrip_count]
+        if log_info:
+            logger.info(f"----- ONE-HAND INFO -----")
+            logger.info(f'button tap value: {onehand["chip"]:.3f}')
+            logger.info(f'button hold value: {onehand["long"]:.3f}')
+        onehand_factor = (onehand["chip"] + onehand["long"]) / button_count - 0.16
+        onehand_factor /= 0.34
+        onehand_factor = clamp(onehand_factor, 0.0, 1.0) + 2
+        onehand_value = (onehand["chip"] + onehand["long"]) / 5.55 * onehand_factor / time_coefficient
+        radar_onehand = int(clamp(onehand_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+        if log_info:
+            logger.info(f"----- HAND-TRIP INFO -----")
+            logger.info(f'button tap value: {handtrip["chip"]:.3f}')
+            logger.info(f'button hold value: {handtrip["long"]:.3f}')
         handtrip_value = (handtrip["chip"] + handtrip["long"]) / time_coefficient
-        self._radar_handtrip = int(clamp(handtrip_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+        radar_handtrip = int(clamp(handtrip_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
 
         # Tricky
         # BPM change, camera change, tilts, spins, jacks = higher radar value
         tricky = {
-            "camera": Decimal("0.0"),
-            "notes": Decimal("0.0"),
-            "bpm_change": Decimal("0.0"),
-            "bpm_dev": Decimal("0.0"),
-            "jacks": Decimal("0.0"),
+            "camera": 0.0,
+            "notes": 0.0,
+            "bpm_change": 0.0,
+            "bpm_dev": 0.0,
+            "jacks": 0.0,
         }
+        # Sorted once, so that the notes within a time range can be found by bisection
+        button_timepts = sorted(timept for _, timepts, _ in button_lanes for timept in timepts)
+        button_times = [self._get_elapsed_time(timept) for timept in button_timepts]
         # Lane spins
         for note_type, spin_start_t, vol in self.note_data.iter_vols():
             # We're only taking spins (which implies slams)
@@ -825,93 +974,122 @@ class ChartInfo:
                 continue
             # This is in ticks
             tricky_increment, spin_duration = SPIN_TYPE_MAP[vol.spin_type]
-            camera_value = Decimal("0.82") if vol.spin_type == SpinType.HALF_SPIN else Decimal("2.2")
+            camera_value = 0.82 if vol.spin_type == SpinType.HALF_SPIN else 2.2
             # Tricky increment from spin
             tricky["camera"] += tricky_increment
             if vol.spin_duration != 0:
                 spin_duration = vol.spin_duration * 48
             spin_end_t = self.add_duration(spin_start_t, spin_duration)
             # Tricky increment from camera
-            button_count = sum(
-                1 for _, note_t, _ in self.note_data.iter_buttons() if spin_start_t <= note_t < spin_end_t
-            )
+            spin_start_index = bisect.bisect_left(button_timepts, spin_start_t)
+            button_count = bisect.bisect_left(button_timepts, spin_end_t, lo=spin_start_index) - spin_start_index
             tricky["notes"] += button_count * camera_value
         # Camera changes
         camera_dicts = [self.spcontroller_data.zoom_bottom, self.spcontroller_data.zoom_top]
         for camera_dict in camera_dicts:
-            is_empty_loop = True
-            cam_data_i = SPControllerInfo(Decimal(), Decimal())
-            cam_data_f = SPControllerInfo(Decimal(), Decimal())
-            for timept_i, timept_f in itertools.pairwise(camera_dict):
-                is_empty_loop = False
-                cam_data_i = camera_dict[timept_i]
-                cam_data_f = camera_dict[timept_f]
-                # Add tricky value for instant changes
-                if cam_data_i.is_snap():
-                    tricky["camera"] += TRICKY_CAM_FLAT_INC
-                # Camera changes also add tricky value
-                tricky["camera"] += TRICKY_CAM_FLAT_INC
-                time_i = self._get_elapsed_time(timept_i)
-                time_f = self._get_elapsed_time(timept_f)
+            # At least two camera points are needed for a camera change
+            if len(camera_dict) < 2:
+                continue
+            # Camera values are stored as Decimal, so convert every camera point once
+            cam_timepts = list(camera_dict)
+            cam_times = [self._get_elapsed_time(timept) for timept in cam_timepts]
+            cam_starts = [float(cam_data.start) * 100 for cam_data in camera_dict.values()]
+            cam_ends = [float(cam_data.end) * 100 for cam_data in camera_dict.values()]
+            cam_snaps = [cam_data.is_snap() for cam_data in camera_dict.values()]
+            # Camera changes add tricky value, and instant changes add more
+            tricky["camera"] += TRICKY_CAM_FLAT_INC * (len(cam_timepts) - 1 + sum(cam_snaps))
+            for i in range(len(cam_timepts) - 1):
+                time_i = cam_times[i]
+                time_f = cam_times[i + 1]
                 # Every note adds tricky depending on camera value
-                # TODO: Optimize this
-                note_timepts = [
-                    note_t for _, note_t, _ in self.note_data.iter_buttons() if timept_i <= note_t < timept_f
-                ]
-                for note_t in note_timepts:
-                    note_s = self._get_elapsed_time(note_t)
-                    cam_val = (cam_data_f.start - cam_data_i.end) * (note_s - time_i) / (time_f - time_i) + (
-                        cam_data_i.end
-                    )
-                    tricky["notes"] += abs(cam_val * 100) ** Decimal("2.5") / 2_100_000
-            if not is_empty_loop and cam_data_f.is_snap():
-                tricky["camera"] += TRICKY_CAM_FLAT_INC
+                note_start = bisect.bisect_left(button_timepts, cam_timepts[i])
+                note_end = bisect.bisect_left(button_timepts, cam_timepts[i + 1], lo=note_start)
+                note_times = button_times[note_start:note_end]
+                if note_times:
+                    # Camera value changes linearly, so work out the line once per pair
+                    cam_start = cam_ends[i]
+                    cam_slope = (cam_starts[i + 1] - cam_ends[i]) / (time_f - time_i)
+                    cam_values = (cam_slope * (note_s - time_i) + cam_start for note_s in note_times)
+                    tricky["notes"] += sum(abs(cam_val) ** 2.5 for cam_val in cam_values) / 2_100_000
         # Lane tilts
-        tricky["camera"] += Decimal("0.002") * len(self.spcontroller_data.tilt)
+        tricky["camera"] += 0.002 * len(self.spcontroller_data.tilt)
         # Jacks
-        last_note_type: NoteType | None = None
-        last_time: Decimal | None = None
         jacks: list[int] = []
-        jack_count = 1
-        for note_type, timept, _ in self.note_data.iter_buttons():
-            if note_type != last_note_type:
-                last_note_type = note_type
-                last_time = None
-                # Check when we switch tracks
-                if jack_count >= 3:
-                    jacks.append(jack_count)
-                jack_count = 1
-            cur_time = self._get_elapsed_time(timept)
-            if last_time is not None:
-                if cur_time - last_time <= TRICKY_JACK_DISTANCE:
+        # Notes exactly at the threshold don't count, so keep rounding errors from pushing them under it
+        max_jack_distance = TRICKY_JACK_DISTANCE - ELAPSED_TIME_TOLERANCE
+        for _, timepts, _ in button_lanes:
+            if not timepts:
+                continue
+            # Compare each note with the previous note on the same track
+            jack_count = 1
+            # Elapsed times were already computed for every button above
+            lane_times = [self._elapsed_time[timept] for timept in timepts]
+            last_time = lane_times[0]
+            for cur_time in lane_times[1:]:
+                if cur_time - last_time < max_jack_distance:
                     jack_count += 1
                 else:
                     if jack_count >= 3:
                         jacks.append(jack_count)
                     jack_count = 1
-            last_time = cur_time
-        # Check for the last track
-        if jack_count >= 3:
-            jacks.append(jack_count)
-        tricky["jacks"] += sum((v ** Decimal("1.85")) / Decimal("2.6") for v in jacks)
+                last_time = cur_time
+            # Check for the end of the track
+            if jack_count >= 3:
+                jacks.append(jack_count)
+        tricky["jacks"] += sum((v**1.85) / 2.6 for v in jacks)
         # BPM changes
-        tricky["bpm_change"] += Decimal("0.8") * (len(self.bpms) - 1)
-        tricky["bpm_change"] += ((len(self.bpms) - 1) ** Decimal("1.155")) / time_coefficient
+        bpm_change_count = len(self.bpms) - 1
+        tricky["bpm_change"] += 0.8 * bpm_change_count
+        tricky["bpm_change"] += (bpm_change_count**1.155) / time_coefficient
         for bpm_value, bpm_duration in self._bpm_durations.items():
-            bpm_ratio = standard_bpm / bpm_value
+            bpm_ratio = float(standard_bpm / bpm_value)
             if bpm_ratio < 1:
                 bpm_ratio = 1 / bpm_ratio
             elif bpm_ratio == 1:
                 continue
-            tricky["bpm_dev"] += 2 * (bpm_ratio ** Decimal("1.25")) * (bpm_duration ** Decimal("0.5"))
-        logger.info(f"----- TRICKY INFO -----")
-        logger.info(f'bpm change tricky: {tricky["bpm_change"]:.3f}')
-        logger.info(f'bpm deviation tricky: {tricky["bpm_dev"]:.3f}')
-        logger.info(f'baseline camera tricky: {tricky["camera"]:.3f}')
-        logger.info(f'note + lane change tricky: {tricky["notes"]:.3f}')
-        logger.info(f'jacks tricky: {tricky["jacks"]:.3f}')
+            tricky["bpm_dev"] += 2 * (bpm_ratio**1.25) * (bpm_duration**0.5)
+        if log_info:
+            logger.info(f"----- TRICKY INFO -----")
+            logger.info(f'bpm change tricky: {tricky["bpm_change"]:.3f}')
+            logger.info(f'bpm deviation tricky: {tricky["bpm_dev"]:.3f}')
+            logger.info(f'baseline camera tricky: {tricky["camera"]:.3f}')
+            logger.info(f'note + lane change tricky: {tricky["notes"]:.3f}')
+            logger.info(f'jacks tricky: {tricky["jacks"]:.3f}')
         tricky_value = sum(tricky.values()) / time_coefficient
-        self._radar_tricky = int(clamp(tricky_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+        radar_tricky = int(clamp(tricky_value, MIN_RADAR_VAL, MAX_RADAR_VAL))
+
+        # Store the results in place of the cached properties, so that calling this again also refreshes them
+        self.__dict__.update(
+            radar_notes=radar_notes,
+            radar_peak=radar_peak,
+            radar_tsumami=radar_tsumami,
+            radar_onehand=radar_onehand,
+            radar_handtrip=radar_handtrip,
+            radar_tricky=radar_tricky,
+        )
+
+    def _update_timesig_keys(self) -> None:
+        """Sort the time signature changes, if any were added since the last call."""
+        # Time signatures may still be added while parsing, so re-sort the keys when that happens
+        if len(self._timesig_keys) != len(self.timesigs):
+            self._timesig_keys = sorted(self.timesigs)
+            self._timesig_measures = [timept.measure for timept in self._timesig_keys]
+            del self._measure_starts[1:]
+
+    def _get_measure_start(self, measure: int) -> Fraction:
+        """
+        Fetch the position of the start of the given measure.
+
+        :param measure: The measure number (measure starts from 1).
+        :returns: The total length of every measure before the given measure.
+        """
+        self._update_timesig_keys()
+        # Extend the measure start positions up to the requested measure
+        while len(self._measure_starts) < measure:
+            measure_count = len(self._measure_starts)
+            self._measure_starts.append(self._measure_starts[-1] + self.get_timesig(measure_count).as_fraction())
+
+        return self._measure_starts[measure - 1]
 
     def get_timesig(self, measure: int) -> TimeSignature:
         """
@@ -921,12 +1099,9 @@ class ChartInfo:
         :returns: The measure's time signature.
         """
         if measure not in self._timesig_cache:
-            prev_timesig = TimeSignature()
-            for timept, timesig in self.timesigs.items():
-                if timept.measure > measure:
-                    break
-                prev_timesig = timesig
-            self._timesig_cache[measure] = prev_timesig
+            self._update_timesig_keys()
+            index = bisect.bisect_right(self._timesig_measures, measure) - 1
+            self._timesig_cache[measure] = self.timesigs[self._timesig_keys[index]] if index >= 0 else TimeSignature()
 
         return self._timesig_cache[measure]
 
@@ -938,12 +1113,11 @@ class ChartInfo:
         :returns: The chart's BPM at that time point.
         """
         if timepoint not in self._bpm_cache:
-            prev_bpm = Decimal()
-            for timept, bpm in self.bpms.items():
-                if timept > timepoint:
-                    break
-                prev_bpm = bpm
-            self._bpm_cache[timepoint] = prev_bpm
+            # BPM changes may still be added while parsing, so re-sort the keys when that happens
+            if len(self._bpm_keys) != len(self.bpms):
+                self._bpm_keys = sorted(self.bpms)
+            index = bisect.bisect_right(self._bpm_keys, timepoint) - 1
+            self._bpm_cache[timepoint] = self.bpms[self._bpm_keys[index]] if index >= 0 else Decimal()
 
         return self._bpm_cache[timepoint]
 
@@ -974,12 +1148,7 @@ class ChartInfo:
         if b < a:
             a, b = b, a
 
-        distance = Fraction()
-        for m_no in range(a.measure, b.measure):
-            distance += self.get_timesig(m_no).as_fraction()
-        distance += b.position - a.position
-
-        return distance
+        return self._get_measure_start(b.measure) - self._get_measure_start(a.measure) + b.position - a.position
 
     def add_duration(self, a: TimePoint, b: Fraction | int) -> TimePoint:
         """
@@ -996,10 +1165,16 @@ class ChartInfo:
         else:
             modified_length = a.position + Fraction(b, TICKS_PER_BAR)
 
+        self._update_timesig_keys()
         m_no = a.measure
         while modified_length >= (m_len := self.get_timesig(m_no).as_fraction()):
-            modified_length -= m_len
-            m_no += 1
+            # Measures have the same length until the next time signature change, so skip them in one step
+            measure_count = int(modified_length // m_len)
+            next_index = bisect.bisect_right(self._timesig_measures, m_no)
+            if next_index < len(self._timesig_measures):
+                measure_count = min(measure_count, self._timesig_measures[next_index] - m_no)
+            modified_length -= measure_count * m_len
+            m_no += measure_count
 
         return TimePoint(m_no, modified_length.numerator, modified_length.denominator)
 
@@ -1030,40 +1205,28 @@ class ChartInfo:
         :returns: A fraction representing the time point.
         """
         if timepoint not in self._time_to_frac_cache:
-            if timepoint == TimePoint():
-                self._time_to_frac_cache[timepoint] = Fraction()
-            elif timepoint.position == 0:
-                prev_timepoint = TimePoint(timepoint.measure - 1, 0, 1)
-                prev_timesig = self.get_timesig(timepoint.measure - 1)
-                self._time_to_frac_cache[timepoint] = (
-                    self.timepoint_to_fraction(prev_timepoint) + prev_timesig.as_fraction()
-                )
-            else:
-                prev_timepoint = TimePoint(timepoint.measure, 0, 1)
-                self._time_to_frac_cache[timepoint] = self.timepoint_to_fraction(prev_timepoint) + timepoint.position
+            self._time_to_frac_cache[timepoint] = self._get_measure_start(timepoint.measure) + timepoint.position
 
         return self._time_to_frac_cache[timepoint]
 
-    @property
+    # The calculation methods store their results on the instance, which then takes precedence over these
+    @cached_property
     def chip_notecount(self) -> int:
         """The number of chip notes in the chart."""
-        if self._chip_notecount == -1:
-            self._calculate_notecounts()
-        return self._chip_notecount
+        self._calculate_notecounts()
+        return self.__dict__["chip_notecount"]
 
-    @property
+    @cached_property
     def long_notecount(self) -> int:
         """The number of long notes in the chart."""
-        if self._long_notecount == -1:
-            self._calculate_notecounts()
-        return self._long_notecount
+        self._calculate_notecounts()
+        return self.__dict__["long_notecount"]
 
-    @property
+    @cached_property
     def vol_notecount(self) -> int:
         """The number of laser notes in the chart."""
-        if self._vol_notecount == -1:
-            self._calculate_notecounts()
-        return self._vol_notecount
+        self._calculate_notecounts()
+        return self.__dict__["vol_notecount"]
 
     @property
     def max_chain(self) -> int:
@@ -1075,44 +1238,38 @@ class ChartInfo:
         """The total ex score of the chart."""
         return 5 * self.chip_notecount + 2 * (self.long_notecount + self.vol_notecount)
 
-    @property
+    @cached_property
     def radar_notes(self) -> int:
         """The value of the NOTES radar."""
-        if self._radar_notes == -1:
-            self.calculate_radar_values()
-        return self._radar_notes
+        self.calculate_radar_values()
+        return self.__dict__["radar_notes"]
 
-    @property
+    @cached_property
     def radar_peak(self) -> int:
         """The value of the PEAK radar."""
-        if self._radar_peak == -1:
-            self.calculate_radar_values()
-        return self._radar_peak
+        self.calculate_radar_values()
+        return self.__dict__["radar_peak"]
 
-    @property
+    @cached_property
     def radar_tsumami(self) -> int:
         """The value of the TSUMAMI radar."""
-        if self._radar_tsumami == -1:
-            self.calculate_radar_values()
-        return self._radar_tsumami
+        self.calculate_radar_values()
+        return self.__dict__["radar_tsumami"]
 
-    @property
+    @cached_property
     def radar_onehand(self) -> int:
         """The value of the ONE-HAND radar."""
-        if self._radar_onehand == -1:
-            self.calculate_radar_values()
-        return self._radar_onehand
+        self.calculate_radar_values()
+        return self.__dict__["radar_onehand"]
 
-    @property
+    @cached_property
     def radar_handtrip(self) -> int:
         """The value of the HAND-TRIP radar."""
-        if self._radar_handtrip == -1:
-            self.calculate_radar_values()
-        return self._radar_handtrip
+        self.calculate_radar_values()
+        return self.__dict__["radar_handtrip"]
 
-    @property
+    @cached_property
     def radar_tricky(self) -> int:
         """The value of the TRICKY radar."""
-        if self._radar_tricky == -1:
-            self.calculate_radar_values()
-        return self._radar_tricky
+        self.calculate_radar_values()
+        return self.__dict__["radar_tricky"]
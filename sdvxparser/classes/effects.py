@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 
 from .base import VoxEntity
 from ..utils import parse_decibel, parse_frequency, parse_length, parse_time
@@ -36,13 +37,31 @@ __all__ = [
 ]
 
 logger = logging.getLogger(__name__)
-_enumToEffect: dict = {}
+_enum_str_cache: dict[Enum, str] = {}
+_NO_EFFECT_VOX_STRING = ",\t".join(["0", "0", "0", "0", "0", "0", "0"])
+
+
+@lru_cache(maxsize=512)
+def _render_vox_string(vox_format: str, values: tuple) -> str:
+    """
+    Render effect parameters as a line in VOX format.
+
+    Most effects keep their default parameters, so the rendered lines are cached.
+
+    :param vox_format: The effect's %-style format template, with one conversion specifier per value.
+    :param values: The values to render, which should match the types of the effect's fields.
+    :returns: The values formatted in VOX format.
+    """
+    return vox_format % values
 
 
 class _StringifiableEnum(Enum):
     def __str__(self) -> str:
-        name_parts = [s.capitalize() for s in self.name.split("_")]
-        return "".join(name_parts)
+        # Members are immutable, so the name only needs to be converted once
+        name_str = _enum_str_cache.get(self)
+        if name_str is None:
+            name_str = _enum_str_cache[self] = "".join([s.capitalize() for s in self.name.split("_")])
+        return name_str
 
 
 class FXType(_StringifiableEnum):
@@ -80,33 +99,65 @@ class WaveShape(_StringifiableEnum):
     SINE = 3
 
 
-@dataclass
+def _parse_inverse_length(s: str) -> float:
+    """Parse a length, and return its reciprocal. This is used for parameters that are frequencies in VOX."""
+    return 1 / parse_length(s)
+
+
+# Effect types are numbered contiguously, so the classes can be indexed by value
+_enumToEffect: list = [None] * (max(fx_type.value for fx_type in FXType) + 1)
+
+
+@dataclass(frozen=True, slots=True)
 class Effect(VoxEntity, ABC):
     """Abstract base class for effects."""
 
+    # Class-level settings are not annotated, so that they are plain class attributes instead of dataclass fields
+    # The enumeration value corresponding to this effect, set by every effect class
+    effect_index = None
+    # %-style format template used by to_vox_string, with one conversion specifier per value
+    _vox_format = ""
+    # Parameters read by from_dict, as (key, attribute name, parse function, scale) tuples
+    # Values are truncated to integers if the attribute is an integer field
+    _parse_schema = ()
+
+    def __init_subclass__(cls, **kwargs):
+        # Zero-argument super() doesn't work in slotted dataclasses, since the class is recreated by the decorator
+        super(Effect, cls).__init_subclass__(**kwargs)
+        # Effect classes are registered by their enumeration value; classes without one are intermediate bases
+        # The dataclass decorator recreates slotted classes, so the final class is the one that stays registered
+        if cls.effect_index is not None:
+            _enumToEffect[cls.effect_index.value] = cls
+
     @property
     def effect_name(self) -> str:
         """Return the effect name."""
         return str(self.effect_index)
 
-    @property
-    @abstractmethod
-    def effect_index(self) -> FXType:
-        """Return the enumeration value corresponding to this effect."""
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def from_dict(s: Mapping[str, str]):
+    @classmethod
+    def from_dict(cls, s: Mapping[str, str]):
         """Create an instance of this effect from a :py:class:`dict` of parameters."""
-        pass
+        return cls._parse_params(s)
+
+    @classmethod
+    def _parse_params(cls, s: Mapping[str, str]):
+        """Create an instance of this effect, with the parameters listed in the parse schema taken from `s`."""
+        params = {}
+        effect_fields = cls.__dataclass_fields__
+        for key, attr, parse_fn, scale in cls._parse_schema:
+            if key in s:
+                value = parse_fn(s[key]) * scale
+                if effect_fields[attr].type is int:
+                    value = int(value)
+                params[attr] = value
+        return cls(**params)
 
     @abstractmethod
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> "Effect":
         """
-        Replace some of this instance's attributes with a sequence of parameters.
+        Return a copy of this instance, with some of its attributes replaced by a sequence of parameters.
 
-        Not all effects implement this method. If unimplemented, this method is a no-op.
+        Not all effects implement this method. If unimplemented, this method returns the instance itself.
         """
         pass
 
@@ -116,41 +167,43 @@ class Effect(VoxEntity, ABC):
 
     def duplicate(self):
         """Create a copy of this object."""
-        return replace(self)
-
+        # Effects are immutable, so the instance itself can be shared
+        return self
 
-def _register_effect(cls):
-    global _enumToEffect
-    _enumToEffect[cls().effect_index] = cls
 
-    return cls
-
-
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NoEffect(Effect):
     """A class representing a null effect."""
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.NO_EFFECT
+    effect_index = FXType.NO_EFFECT
 
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        return NoEffect()
+    @classmethod
+    def from_dict(cls, s: Mapping[str, str]):
+        return _NO_EFFECT
 
-    def map_params(self, s: Sequence[int]) -> None:
-        return
+    def map_params(self, s: Sequence[int]) -> Effect:
+        return self
 
     def to_vox_string(self) -> str:
-        return ",\t".join([f"{self.effect_index.value}", "0", "0", "0", "0", "0", "0"])
+        return _NO_EFFECT_VOX_STRING
 
 
-@_register_effect
-@dataclass
+# Null effects have no parameters, so a single instance is shared wherever possible
+_NO_EFFECT = NoEffect()
+
+
+@dataclass(frozen=True, slots=True)
 class Retrigger(Effect):
     """A class representing a retrigger effect."""
 
+    effect_index = FXType.RETRIGGER
+    _vox_format = "%d,\t%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+    _parse_schema = (
+        ("updatePeriod", "update_period", parse_length, 4),
+        ("rate", "amount", parse_length, 1),
+        ("mix", "mix", parse_length, 100),
+    )
+
     mix: float = 95.00
     wavelength: int = 4
     update_period: float = 2.00
@@ -158,80 +211,79 @@ class Retrigger(Effect):
     amount: float = 0.85
     decay: float = 0.15
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.RETRIGGER
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Retrigger()
-        if "updatePeriod" in s:
-            effect.update_period = parse_length(s["updatePeriod"]) * 4
+    @classmethod
+    def from_dict(cls, s: Mapping[str, str]):
+        effect = cls._parse_params(s)
+        # This depends on the update period
         if "waveLength" in s:
-            effect.wavelength = int(effect.update_period / 4 / parse_length(s["waveLength"]))
-        if "rate" in s:
-            effect.amount = parse_length(s["rate"])
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
+            effect = replace(effect, wavelength=int(effect.update_period / 4 / parse_length(s["waveLength"])))
         return effect
 
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> Effect:
         if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 parameter (got {len(s)})")
-            return
-        self.wavelength = int(s[0] * self.update_period / 4)
+            logger.warning("%s requires 1 parameter (got %d)", type(self).__name__, len(s))
+            return self
+        return replace(self, wavelength=int(s[0] * self.update_period / 4))
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.wavelength}",
-                f"{self.mix:.2f}",
-                f"{self.update_period:.2f}",
-                f"{self.feedback:.2f}",
-                f"{self.amount:.2f}",
-                f"{self.decay:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (
+                self.effect_index.value,
+                self.wavelength,
+                self.mix,
+                self.update_period,
+                self.feedback,
+                self.amount,
+                self.decay,
+            ),
         )
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Gate(Effect):
     """A class representing a gate effect."""
 
+    effect_index = FXType.GATE
+    _vox_format = "%d,\t%.2f,\t%d,\t%.2f"
+    _parse_schema = (("mix", "mix", parse_length, 100),)
+
     mix: float = 98.00
     wavelength: int = 16
     length: float = 2.00
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.GATE
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Gate()
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
+    @classmethod
+    def from_dict(cls, s: Mapping[str, str]):
+        effect = cls._parse_params(s)
+        # This depends on the gate length
         if "waveLength" in s:
-            effect.wavelength = int(effect.length / 2 / parse_length(s["waveLength"]))
+            effect = replace(effect, wavelength=int(effect.length / 2 / parse_length(s["waveLength"])))
         return effect
 
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> Effect:
         if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 parameter (got {len(s)})")
-            return
-        self.wavelength = int(s[0] * self.length / 2)
+            logger.warning("%s requires 1 parameter (got %d)", type(self).__name__, len(s))
+            return self
+        return replace(self, wavelength=int(s[0] * self.length / 2))
 
     def to_vox_string(self) -> str:
-        return ",\t".join([f"{self.effect_index.value}", f"{self.mix:.2f}", f"{self.wavelength}", f"{self.length:.2f}"])
+        return _render_vox_string(self._vox_format, (self.effect_index.value, self.mix, self.wavelength, self.length))
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Flanger(Effect):
     """A class representing a flanger effect."""
 
+    effect_index = FXType.FLANGER
+    _vox_format = "%d,\t%.2f,\t%.2f,\t%.2f,\t%d,\t%.2f"
+    _parse_schema = (
+        ("period", "period", parse_length, 4),
+        ("feedback", "feedback", parse_length, 1),
+        ("stereoWidth", "stereo_width", parse_length, 100),
+        ("hiCutGain", "hicut_gain", parse_decibel, 1),
+        ("mix", "mix", parse_length, 100),
+    )
+
     # Parameter names yoinked off VoxCharger lol
     mix: float = 75.00
     period: float = 2.00
@@ -239,125 +291,86 @@ class Flanger(Effect):
     stereo_width: int = 90
     hicut_gain: float = 2.00
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.FLANGER
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Flanger()
-        if "period" in s:
-            effect.period = parse_length(s["period"]) * 4
-        if "feedback" in s:
-            effect.feedback = parse_length(s["feedback"])
-        if "stereoWidth" in s:
-            effect.stereo_width = int(parse_length(s["stereoWidth"]) * 100)
-        if "hiCutGain" in s:
-            effect.hicut_gain = parse_decibel(s["hiCutGain"])
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
-
-    def map_params(self, s: Sequence[int]) -> None:
-        pass
+    def map_params(self, s: Sequence[int]) -> Effect:
+        return self
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.period:.2f}",
-                f"{self.feedback:.2f}",
-                f"{self.stereo_width}",
-                f"{self.hicut_gain:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (self.effect_index.value, self.mix, self.period, self.feedback, self.stereo_width, self.hicut_gain),
         )
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Tapestop(Effect):
     """A class representing a tapestop effect."""
 
+    effect_index = FXType.TAPESTOP
+    _vox_format = "%d,\t%.2f,\t%.2f,\t%.2f"
+    _parse_schema = (
+        ("speed", "speed", parse_length, 0.16),
+        ("mix", "mix", parse_length, 100),
+    )
+
     mix: float = 100.00
     speed: float = 8.00
     rate: float = 0.40
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.TAPESTOP
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Tapestop()
-        if "speed" in s:
-            effect.speed = parse_length(s["speed"]) * 0.16
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
-
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> Effect:
         if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 parameter (got {len(s)})")
-            return
-        self.speed = s[0] * 0.16
+            logger.warning("%s requires 1 parameter (got %d)", type(self).__name__, len(s))
+            return self
+        return replace(self, speed=s[0] * 0.16)
 
     def to_vox_string(self) -> str:
-        return ",\t".join([f"{self.effect_index.value}", f"{self.mix:.2f}", f"{self.speed:.2f}", f"{self.rate:.2f}"])
+        return _render_vox_string(self._vox_format, (self.effect_index.value, self.mix, self.speed, self.rate))
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Sidechain(Effect):
     """A class representing a sidechain effect."""
 
+    effect_index = FXType.SIDECHAIN
+    _vox_format = "%d,\t%.2f,\t%.2f,\t%d,\t%d,\t%d"
+    _parse_schema = (
+        ("period", "frequency", _parse_inverse_length, 0.25),
+        ("attackTime", "attack", parse_time, 1),
+        ("holdTime", "hold", parse_time, 1),
+        ("releaseTime", "release", parse_time, 1),
+        # Not actually in KSM spec
+        ("mix", "mix", parse_length, 100),
+    )
+
     mix: float = 90.00
     frequency: float = 1.00
     attack: int = 45
     hold: int = 50
     release: int = 60
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.SIDECHAIN
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Sidechain()
-        if "period" in s:
-            effect.frequency = 0.25 / parse_length(s["period"])
-        if "attackTime" in s:
-            effect.attack = int(parse_time(s["attackTime"]))
-        if "holdTime" in s:
-            effect.hold = int(parse_time(s["holdTime"]))
-        if "releaseTime" in s:
-            effect.release = int(parse_time(s["releaseTime"]))
-        # Not actually in KSM spec
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
-
-    def map_params(self, s: Sequence[int]) -> None:
-        pass
+    def map_params(self, s: Sequence[int]) -> Effect:
+        return self
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.frequency:.2f}",
-                f"{self.attack}",
-                f"{self.hold}",
-                f"{self.release}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (self.effect_index.value, self.mix, self.frequency, self.attack, self.hold, self.release),
         )
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Wobble(Effect):
     """A class representing a wobble effect."""
 
+    effect_index = FXType.WOBBLE
+    _vox_format = "%d,\t%d,\t%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+    _parse_schema = (
+        ("waveLength", "frequency", _parse_inverse_length, 0.25),
+        ("loFreq", "low_cutoff", parse_frequency, 1),
+        ("hiFreq", "hi_cutoff", parse_frequency, 1),
+        ("Q", "bandwidth", float, 1),
+        ("mix", "mix", parse_length, 100),
+    )
+
     mix: float = 80.00
     filter_type: PassFilterType = PassFilterType.LOW_PASS
     wave_shape: WaveShape = WaveShape.SINE
@@ -366,79 +379,63 @@ class Wobble(Effect):
     frequency: float = 4.00
     bandwidth: float = 1.40
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.WOBBLE
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Wobble()
-        if "waveLength" in s:
-            effect.frequency = 0.25 / parse_length(s["waveLength"])
-        if "loFreq" in s:
-            effect.low_cutoff = parse_frequency(s["loFreq"])
-        if "hiFreq" in s:
-            effect.hi_cutoff = parse_frequency(s["hiFreq"])
-        if "Q" in s:
-            effect.bandwidth = float(s["Q"])
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
-
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> Effect:
         if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 parameter (got {len(s)})")
-            return
-        self.frequency = s[0] / 4
+            logger.warning("%s requires 1 parameter (got %d)", type(self).__name__, len(s))
+            return self
+        return replace(self, frequency=s[0] / 4)
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.filter_type.value}",
-                f"{self.wave_shape.value}",
-                f"{self.mix:.2f}",
-                f"{self.low_cutoff:.2f}",
-                f"{self.hi_cutoff:.2f}",
-                f"{self.frequency:.2f}",
-                f"{self.bandwidth:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (
+                self.effect_index.value,
+                self.filter_type.value,
+                self.wave_shape.value,
+                self.mix,
+                self.low_cutoff,
+                self.hi_cutoff,
+                self.frequency,
+                self.bandwidth,
+            ),
         )
 
 
-@_register_effect
-@dataclass
-class Bitcrush(Effect):
-    """A class representing a bitcrush effect."""
+@dataclass(frozen=True, slots=True)
+class _MixAmountEffect(Effect):
+    """Base class for effects that are described by a mix and a single integer amount."""
+
+    _vox_format = "%d,\t%.2f,\t%d"
 
     mix: float = 100.00
     amount: int = 12
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.BITCRUSH
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = Bitcrush()
-        if "reduction" in s and s["reduction"].endswith("samples"):
-            effect.amount = int(s["reduction"][:-7])
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
-
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> Effect:
         if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 parameter (got {len(s)})")
-            return
-        self.amount = s[0]
+            logger.warning("%s requires 1 parameter (got %d)", type(self).__name__, len(s))
+            return self
+        return replace(self, amount=s[0])
 
     def to_vox_string(self) -> str:
-        return ",\t".join([f"{self.effect_index.value}", f"{self.mix:.2f}", f"{self.amount}"])
+        return _render_vox_string(self._vox_format, (self.effect_index.value, self.mix, self.amount))
+
+
+@dataclass(frozen=True, slots=True)
+class Bitcrush(_MixAmountEffect):
+    """A class representing a bitcrush effect."""
+
+    effect_index = FXType.BITCRUSH
+    _parse_schema = (("mix", "mix", parse_length, 100),)
+
+    @classmethod
+    def from_dict(cls, s: Mapping[str, str]):
+        effect = cls._parse_params(s)
+        if "reduction" in s and s["reduction"].endswith("samples"):
+            effect = replace(effect, amount=int(s["reduction"][:-7]))
+        return effect
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetriggerEx(Effect):
     """
     A class representing a retrigger effect.
@@ -446,6 +443,15 @@ class RetriggerEx(Effect):
     This effect samples from the start of the effect, instead of at the beginning of the update period.
     """
 
+    effect_index = FXType.RETRIGGER_EX
+    _vox_format = "%d,\t%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+    _parse_schema = (
+        ("waveLength", "wavelength", _parse_inverse_length, 1),
+        ("feedbackLevel", "feedback", parse_length, 1),
+        ("rate", "amount", parse_length, 1),
+        ("mix", "mix", parse_length, 100),
+    )
+
     mix: float = 95.00
     wavelength: int = 8
     update_period: float = 2.00
@@ -453,179 +459,113 @@ class RetriggerEx(Effect):
     amount: float = 0.85
     decay: float = 0.15
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.RETRIGGER_EX
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = RetriggerEx()
-        effect.update_period = 4.00
-        if "waveLength" in s:
-            effect.wavelength = int(1 / parse_length(s["waveLength"]))
-        if "feedbackLevel" in s:
-            effect.feedback = parse_length(s["feedbackLevel"])
-        if "rate" in s:
-            effect.amount = parse_length(s["rate"])
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
+    @classmethod
+    def from_dict(cls, s: Mapping[str, str]):
+        return replace(cls._parse_params(s), update_period=4.00)
 
-    def map_params(self, s: Sequence[int]) -> None:
+    def map_params(self, s: Sequence[int]) -> Effect:
         if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 or 2 parameters (got {len(s)})")
-            return
+            logger.warning("%s requires 1 or 2 parameters (got %d)", type(self).__name__, len(s))
+            return self
+        wavelength = int(s[0] * self.update_period / 4)
         if len(s) >= 2:
-            self.feedback = s[1] / 100
-        self.wavelength = int(s[0] * self.update_period / 4)
+            return replace(self, wavelength=wavelength, feedback=s[1] / 100)
+        return replace(self, wavelength=wavelength)
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.wavelength}",
-                f"{self.mix:.2f}",
-                f"{self.update_period:.2f}",
-                f"{self.feedback:.2f}",
-                f"{self.amount:.2f}",
-                f"{self.decay:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (
+                self.effect_index.value,
+                self.wavelength,
+                self.mix,
+                self.update_period,
+                self.feedback,
+                self.amount,
+                self.decay,
+            ),
         )
 
 
-@_register_effect
-@dataclass
-class PitchShift(Effect):
+@dataclass(frozen=True, slots=True)
+class PitchShift(_MixAmountEffect):
     """A class representing a pitch shift effect."""
 
-    mix: float = 100.00
-    amount: int = 12
-
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.PITCH_SHIFT
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        effect = PitchShift()
-        if "pitch" in s:
-            effect.amount = int(float(s["pitch"]))
-        if "mix" in s:
-            effect.mix = parse_length(s["mix"]) * 100
-        return effect
-
-    def map_params(self, s: Sequence[int]) -> None:
-        if len(s) < 1:
-            logger.warning(f"{self.__class__.__name__} requires 1 parameter (got {len(s)})")
-            return
-        self.amount = s[0]
-
-    def to_vox_string(self) -> str:
-        return ",\t".join([f"{self.effect_index.value}", f"{self.mix:.2f}", f"{self.amount}"])
+    effect_index = FXType.PITCH_SHIFT
+    _parse_schema = (
+        ("pitch", "amount", float, 1),
+        ("mix", "mix", parse_length, 100),
+    )
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Tapescratch(Effect):
     """A class representing a tapescratch effect."""
 
+    effect_index = FXType.TAPESCRATCH
+    _vox_format = "%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+
     mix: float = 100.00
     curve_slope: float = 5.00
     attack: float = 1.00
     hold: float = 0.10
     release: float = 1.00
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.TAPESCRATCH
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        return Tapescratch()
-
-    def map_params(self, s: Sequence[int]) -> None:
-        pass
+    def map_params(self, s: Sequence[int]) -> Effect:
+        return self
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.curve_slope:.2f}",
-                f"{self.attack:.2f}",
-                f"{self.hold:.2f}",
-                f"{self.release:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (self.effect_index.value, self.mix, self.curve_slope, self.attack, self.hold, self.release),
         )
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LowpassFilter(Effect):
     """A class representing a low-pass filter effect."""
 
+    effect_index = FXType.LOW_PASS_FILTER
+    _vox_format = "%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+
     mix: float = 75.00
     low_cutoff: float = 400.00
     hi_cutoff: float = 900.00
     bandwidth: float = 2.00  # Haven't quite figured this one out, actually
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.LOW_PASS_FILTER
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        return LowpassFilter()
-
-    def map_params(self, s: Sequence[int]) -> None:
-        pass
+    def map_params(self, s: Sequence[int]) -> Effect:
+        return self
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.low_cutoff:.2f}",
-                f"{self.hi_cutoff:.2f}",
-                f"{self.bandwidth:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (self.effect_index.value, self.mix, self.low_cutoff, self.hi_cutoff, self.bandwidth),
         )
 
 
-@_register_effect
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HighpassFilter(Effect):
     """A class representing a high-pass filter effect."""
 
+    effect_index = FXType.HIGH_PASS_FILTER
+    _vox_format = "%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+
     mix: float = 100.00
     cutoff: float = 2000.00
     curve_slope: float = 5.00
     bandwidth: float = 1.40
 
-    @property
-    def effect_index(self) -> FXType:
-        return FXType.HIGH_PASS_FILTER
-
-    @staticmethod
-    def from_dict(s: Mapping[str, str]):
-        return HighpassFilter()
-
-    def map_params(self, s: Sequence[int]) -> None:
-        pass
+    def map_params(self, s: Sequence[int]) -> Effect:
+        return self
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.effect_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.cutoff:.2f}",
-                f"{self.curve_slope:.2f}",
-                f"{self.bandwidth:.2f}",
-            ]
+        return _render_vox_string(
+            self._vox_format,
+            (self.effect_index.value, self.mix, self.cutoff, self.curve_slope, self.bandwidth),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EffectEntry(VoxEntity):
     """
     A class representing a single effect setting.
@@ -633,82 +573,92 @@ class EffectEntry(VoxEntity):
     A single effect setting consists of two effects rendered together.
     """
 
-    effect1: Effect = field(default_factory=NoEffect)
-    effect2: Effect = field(default_factory=NoEffect)
+    effect1: Effect = field(default_factory=lambda: _NO_EFFECT)
+    effect2: Effect = field(default_factory=lambda: _NO_EFFECT)
 
     def __str__(self) -> str:
         return f"{self.effect1.effect_name}, {self.effect2.effect_name}"
 
     def to_vox_string(self) -> str:
-        return f"{self.effect1.to_vox_string()}\n" f"{self.effect2.to_vox_string()}\n"
+        return _render_effect_entry(self)
+
+
+@lru_cache(maxsize=256)
+def _render_effect_entry(entry: EffectEntry) -> str:
+    """Render an effect entry in VOX format. Entries are immutable, so charts that reuse an entry render it once."""
+    return f"{entry.effect1.to_vox_string()}\n" f"{entry.effect2.to_vox_string()}\n"
 
 
 def enum_to_effect(val: FXType) -> type[Effect]:
     """Return the class corresponding to an enumeration member."""
-    return _enumToEffect[val]
+    return _enumToEffect[val.value]
+
+
+_DEFAULT_EFFECTS = (
+    # Re8
+    EffectEntry(Retrigger()),
+    # Re16
+    EffectEntry(Retrigger(wavelength=8, decay=0.1)),
+    # Ga16
+    EffectEntry(Gate()),
+    # Flanger
+    EffectEntry(Flanger()),
+    # Re32
+    EffectEntry(Retrigger(wavelength=16, amount=0.87, decay=0.13)),
+    # Ga8
+    EffectEntry(Gate(wavelength=4)),
+    # Echo4
+    EffectEntry(RetriggerEx(mix=100, wavelength=4, update_period=4, feedback=0.6, amount=1, decay=0.8)),
+    # Tapestop
+    EffectEntry(Tapestop()),
+    # Sidechain
+    EffectEntry(Sidechain()),
+    # Wo12
+    EffectEntry(Wobble()),
+    # Re12
+    EffectEntry(Retrigger(wavelength=6)),
+    # Bitcrush
+    EffectEntry(Bitcrush()),
+)
 
 
 def get_default_effects() -> list[EffectEntry]:
     """Get the default effect settings."""
-    return [
-        # Re8
-        EffectEntry(Retrigger()),
-        # Re16
-        EffectEntry(Retrigger(wavelength=8, decay=0.1)),
-        # Ga16
-        EffectEntry(Gate()),
-        # Flanger
-        EffectEntry(Flanger()),
-        # Re32
-        EffectEntry(Retrigger(wavelength=16, amount=0.87, decay=0.13)),
-        # Ga8
-        EffectEntry(Gate(wavelength=4)),
-        # Echo4
-        EffectEntry(RetriggerEx(mix=100, wavelength=4, update_period=4, feedback=0.6, amount=1, decay=0.8)),
-        # Tapestop
-        EffectEntry(Tapestop()),
-        # Sidechain
-        EffectEntry(Sidechain()),
-        # Wo12
-        EffectEntry(Wobble()),
-        # Re12
-        EffectEntry(Retrigger(wavelength=6)),
-        # Bitcrush
-        EffectEntry(Bitcrush()),
-    ]
+    # Effect entries are immutable, so the defaults can be handed out directly
+    return list(_DEFAULT_EFFECTS)
+
+
+KSH_EFFECT_TYPE_MAP: dict[str, type[Effect]] = {
+    "Retrigger": Retrigger,
+    "Echo": Retrigger,
+    "Gate": Gate,
+    "Flanger": Flanger,
+    "PitchShift": PitchShift,
+    "BitCrusher": Bitcrush,
+    "Phaser": Flanger,
+    "Wobble": Wobble,
+    "TapeStop": Tapestop,
+    "SideChain": Sidechain,
+}
+"""Mapping of KSH effect types to the effect classes they are converted to."""
 
 
 def from_definition(definition: MutableMapping[str, str]) -> Effect:
     """Construct an effect object from a parameter-value map."""
-    effect_class: type[Effect]
-    if definition["type"] in ["Retrigger", "Echo"]:
-        effect_class = Retrigger
+    effect_type = definition["type"]
+    effect_class = KSH_EFFECT_TYPE_MAP.get(effect_type)
+    if effect_class is None:
+        logger.warning('custom fx not parsed: "%s"', definition)
+        return _NO_EFFECT
+    if effect_class is Retrigger:
         if "updatePeriod" in definition:
             value = parse_length(definition["updatePeriod"])
             if value == 0:
                 effect_class = RetriggerEx
-    elif definition["type"] == "Gate":
-        effect_class = Gate
-    elif definition["type"] == "Flanger":
-        effect_class = Flanger
-    elif definition["type"] == "PitchShift":
-        effect_class = PitchShift
-    elif definition["type"] == "BitCrusher":
-        effect_class = Bitcrush
-    elif definition["type"] == "Phaser":
-        effect_class = Flanger
+    elif effect_type == "Phaser":
         definition["period"] = definition.get("period", "1/2")
         definition["feedback"] = definition.get("feedback", "35%")
         definition["stereo_width"] = definition.get("stereoWidth", "0%")
         definition["hicut_gain"] = definition.get("hiCutGain", "8dB")
         definition["mix"] = definition.get("mix", "50%")
-    elif definition["type"] == "Wobble":
-        effect_class = Wobble
-    elif definition["type"] == "TapeStop":
-        effect_class = Tapestop
-    elif definition["type"] == "SideChain":
-        effect_class = Sidechain
-    else:
-        logger.warning(f'custom fx not parsed: "{definition}"')
-        return NoEffect()
     return effect_class.from_dict(definition)
@@ -12,6 +12,8 @@ __all__ = [
     "TiltType",
     "FilterIndex",
     "SegmentFlag",
+    "SEGMENT_START_BIT",
+    "SEGMENT_END_BIT",
     "VOXSection",
     "NoteType",
 ]
@@ -126,9 +128,13 @@ class GameBackground(Enum):
     HEXA_DIVER_APOCALYPSE_RAY = 102
     HEXA_DIVER_HEAVENS_RAIN = 103
 
-    def __str__(self) -> str:
+    def __init__(self, value: int):
+        # Members are immutable, so their display names are built once
         name_parts = [s.capitalize() for s in self.name.split("_")]
-        return " ".join(name_parts) + f" ({self.value})"
+        self._display_str = " ".join(name_parts) + f" ({value})"
+
+    def __str__(self) -> str:
+        return self._display_str
 
 
 class InfVer(Enum):
@@ -140,8 +146,12 @@ class InfVer(Enum):
     VIVID = 5
     EXCEED = 6
 
+    def __init__(self, value: int):
+        # Members are immutable, so their display names are built once
+        self._display_str = f"{self.name.capitalize()} ({value})"
+
     def __str__(self) -> str:
-        return f"{self.name.capitalize()} ({self.value})"
+        return self._display_str
 
 
 class DifficultySlot(Enum):
@@ -153,11 +163,16 @@ class DifficultySlot(Enum):
     INFINITE = 4
     MAXIMUM = 5
 
+    def __init__(self, value: int):
+        # Members are immutable, so their display names are built once
+        self._display_str = f"{self.name.capitalize()} ({value})"
+        self._shorthand = f"{value}{self.name.lower()[0]}"
+
     def __str__(self) -> str:
-        return f"{self.name.capitalize()} ({self.value})"
+        return self._display_str
 
     def to_shorthand(self) -> str:
-        return f"{self.value}{self.name.lower()[0]}"
+        return self._shorthand
 
 
 class SpinType(Enum):
@@ -209,6 +224,12 @@ class SegmentFlag(Flag):
     POINT = 3
 
 
+SEGMENT_START_BIT = SegmentFlag.START.value
+"""Integer bit of `SegmentFlag.START`, for testing `point_type.value` without going through `Flag.__contains__`."""
+SEGMENT_END_BIT = SegmentFlag.END.value
+"""Integer bit of `SegmentFlag.END`, for testing `point_type.value` without going through `Flag.__contains__`."""
+
+
 class VOXSection(Enum):
     """Enumeration for VOX file format sections."""
 
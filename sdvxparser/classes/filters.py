@@ -1,9 +1,11 @@
 """
 Classes and functions that represent and handle filters.
 """
+import copy
+
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 from .base import VoxEntity
 
@@ -19,8 +21,13 @@ __all__ = [
     "get_default_autotab",
 ]
 
+# %-style templates for the fixed-width VOX lines, so rendering is a single formatting operation
+_PASS_FILTER_VOX_FORMAT = "%d,\t%.2f,\t%.2f,\t%.2f,\t%.2f"
+_BITCRUSH_FILTER_VOX_FORMAT = "%d,\t%.2f,\t%d"
+_AUTOTAB_SETTING_VOX_FORMAT = "%d,\t%d,\t%.2f,\t%.2f"
+
 
-class KSHFilterType(Enum):
+class KSHFilterType(IntEnum):
     """Enumeration for KSH filter types."""
 
     PEAK = 0
@@ -29,98 +36,90 @@ class KSHFilterType(Enum):
     BITCRUSH = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class Filter(VoxEntity, ABC):
     """Abstract base class for laser filters."""
 
-    @property
-    @abstractmethod
-    def filter_index(self) -> KSHFilterType:
-        """Return the enumeration value corresponding to this filter."""
-        pass
+    # Class-level settings are not annotated, so that they are plain class attributes instead of dataclass fields
+    # The enumeration member corresponding to this filter, set by every filter class
+    filter_index = None
+    # The enumeration value of filter_index, precomputed so that to_vox_string doesn't look it up on every call
+    _filter_index_value = None
 
     @abstractmethod
     def to_vox_string(self) -> str:
         pass
 
 
-@dataclass
-class LowpassFilter(Filter):
-    """A class representing a low-pass filter on lasers."""
+@dataclass(slots=True)
+class _PassFilter(Filter):
+    """Base class for filters that sweep a cutoff frequency on lasers."""
 
     mix: float = 90.00
     min_cutoff: float = 400.00
     max_cutoff: float = 18000.00
     bandwidth: float = 0.70
 
-    @property
-    def filter_index(self) -> KSHFilterType:
-        return KSHFilterType.LPF
-
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.filter_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.min_cutoff:.2f}",
-                f"{self.max_cutoff:.2f}",
-                f"{self.bandwidth:.2f}",
-            ]
+        return _PASS_FILTER_VOX_FORMAT % (
+            self._filter_index_value,
+            self.mix,
+            self.min_cutoff,
+            self.max_cutoff,
+            self.bandwidth,
         )
 
 
-@dataclass
-class HighpassFilter(Filter):
+@dataclass(slots=True)
+class LowpassFilter(_PassFilter):
+    """A class representing a low-pass filter on lasers."""
+
+    filter_index = KSHFilterType.LPF
+    _filter_index_value = int(KSHFilterType.LPF)
+
+
+@dataclass(slots=True)
+class HighpassFilter(_PassFilter):
     """A class representing a high-pass filter on lasers."""
 
-    mix: float = 90.00
+    filter_index = KSHFilterType.HPF
+    _filter_index_value = int(KSHFilterType.HPF)
+
     min_cutoff: float = 40.00
     max_cutoff: float = 5000.00
-    bandwidth: float = 0.70
-
-    @property
-    def filter_index(self) -> KSHFilterType:
-        return KSHFilterType.HPF
-
-    def to_vox_string(self) -> str:
-        return ",\t".join(
-            [
-                f"{self.filter_index.value}",
-                f"{self.mix:.2f}",
-                f"{self.min_cutoff:.2f}",
-                f"{self.max_cutoff:.2f}",
-                f"{self.bandwidth:.2f}",
-            ]
-        )
 
 
-@dataclass
+@dataclass(slots=True)
 class BitcrushFilter(Filter):
     """A class representing a bitcrush filter on lasers."""
 
+    filter_index = KSHFilterType.BITCRUSH
+    _filter_index_value = int(KSHFilterType.BITCRUSH)
+
     mix: float = 100.00
     max_amount: int = 30
 
-    @property
-    def filter_index(self) -> KSHFilterType:
-        return KSHFilterType.BITCRUSH
-
     def to_vox_string(self) -> str:
-        return ",\t".join([f"{self.filter_index.value}", f"{self.mix:.2f}", f"{self.max_amount}"])
+        return _BITCRUSH_FILTER_VOX_FORMAT % (self._filter_index_value, self.mix, self.max_amount)
+
+
+_DEFAULT_FILTERS = (
+    LowpassFilter(),
+    LowpassFilter(min_cutoff=600.00, max_cutoff=15000.00, bandwidth=5.00),
+    HighpassFilter(),
+    HighpassFilter(max_cutoff=2000.00, bandwidth=3.00),
+    BitcrushFilter(),
+)
 
 
 def get_default_filters() -> list[Filter]:
     """Get the default filter settings."""
-    return [
-        LowpassFilter(),
-        LowpassFilter(min_cutoff=600.00, max_cutoff=15000.00, bandwidth=5.00),
-        HighpassFilter(),
-        HighpassFilter(max_cutoff=2000.00, bandwidth=3.00),
-        BitcrushFilter(),
-    ]
+    # Filters can be modified, so copies are handed out
+    # Filters only hold scalar values, so shallow copies are enough
+    return [copy.copy(f) for f in _DEFAULT_FILTERS]
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoTabSetting(VoxEntity):
     """
     A class that represents a single auto-tab setting.
@@ -134,12 +133,10 @@ class AutoTabSetting(VoxEntity):
     max_value: float = 0.00
 
     def to_vox_string(self) -> str:
-        return ",\t".join(
-            [f"{self.effect_index}", f"{self.param_index}", f"{self.min_value:.2f}", f"{self.max_value:.2f}"]
-        )
+        return _AUTOTAB_SETTING_VOX_FORMAT % (self.effect_index, self.param_index, self.min_value, self.max_value)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoTabEntry(VoxEntity):
     """
     A class that represents a single auto-tab entry.
@@ -150,27 +147,17 @@ class AutoTabEntry(VoxEntity):
     effect1: AutoTabSetting
     effect2: AutoTabSetting
 
-    def __init__(self, effect_index: int) -> None:
-        self.effect1 = AutoTabSetting(effect_index)
-        self.effect2 = AutoTabSetting(effect_index)
+    @classmethod
+    def from_index(cls, effect_index: int) -> "AutoTabEntry":
+        """Create an auto-tab entry with default settings for the effect at the given index."""
+        # The settings are edited independently, so each one gets its own object
+        return cls(AutoTabSetting(effect_index), AutoTabSetting(effect_index))
 
     def to_vox_string(self) -> str:
-        return f"{self.effect1.to_vox_string()}\n" f"{self.effect1.to_vox_string()}\n"
+        return f"{self.effect1.to_vox_string()}\n{self.effect2.to_vox_string()}\n"
 
 
 def get_default_autotab() -> list[AutoTabEntry]:
     """Get the default auto-tab settings."""
-    return [
-        AutoTabEntry(0),
-        AutoTabEntry(1),
-        AutoTabEntry(2),
-        AutoTabEntry(3),
-        AutoTabEntry(4),
-        AutoTabEntry(5),
-        AutoTabEntry(6),
-        AutoTabEntry(7),
-        AutoTabEntry(8),
-        AutoTabEntry(9),
-        AutoTabEntry(10),
-        AutoTabEntry(11),
-    ]
+    # Entries hold mutable settings, so fresh ones are built instead of shallow-copying shared ones
+    return [AutoTabEntry.from_index(i) for i in range(12)]
@@ -2,7 +2,6 @@
 Classes that encapsulate song metadata.
 """
 from dataclasses import dataclass
-from decimal import Decimal
 from time import strftime
 
 from .enums import GameBackground, InfVer
@@ -12,7 +11,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class SongInfo:
     """A class that contains all song metadata, which applies to all charts of it."""
 
@@ -22,12 +21,15 @@ class SongInfo:
     artist: str = ""
     artist_yomigana: str = ""
     ascii_label: str = ""
-    min_bpm: Decimal = Decimal()
-    max_bpm: Decimal = Decimal()
+    # BPMs here are only displayed and written to XML, so they don't need the exactness of the chart's BPMs
+    min_bpm: float = 0.0
+    max_bpm: float = 0.0
     release_date: str = ""
     music_volume: int = 100
     background: GameBackground = GameBackground.EXCEED_GEAR_TOWER_1
     inf_ver: InfVer = InfVer.INFINITE
 
     def __post_init__(self):
-        self.release_date = strftime("%Y%m%d")
+        # Default to the current date, but keep a release date that was given explicitly
+        if not self.release_date:
+            self.release_date = strftime("%Y%m%d")
@@ -1,8 +1,10 @@
 """
 Classes representing time-related entities.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from fractions import Fraction
+from functools import lru_cache
+from math import gcd
 
 from .base import Validateable
 
@@ -12,15 +14,30 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=64)
+def _timesig_to_fraction(upper: int, lower: int) -> Fraction:
+    # Charts only use a handful of distinct time signatures, so reuse the Fraction objects
+    return Fraction(upper, lower)
+
+
+@lru_cache(maxsize=4096)
+def _position_to_fraction(num: int, den: int) -> Fraction:
+    # Positions within a measure come from a small set of subdivisions, so time points share the Fraction objects
+    return Fraction(num, den)
+
+
+@dataclass(frozen=True, slots=True)
 class TimeSignature(Validateable):
     """An immutable class that represents a time signature."""
 
     upper: int = 4
     lower: int = 4
+    # Time signatures are immutable, so the fraction is resolved once on construction
+    _fraction: Fraction = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.validate()
+        object.__setattr__(self, "_fraction", _timesig_to_fraction(self.upper, self.lower))
 
     def validate(self):
         if self.upper <= 0:
@@ -34,29 +51,110 @@ class TimeSignature(Validateable):
 
         :returns: A :class:`~fractions.Fraction` object.
         """
-        return Fraction(self.upper, self.lower)
+        return self._fraction
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class TimePoint(Validateable):
-    """An immutable, ordered class that represents a point in time, subject to the prevailing time signature."""
+    """
+    An immutable, ordered class that represents a point in time, subject to the prevailing time signature.
+
+    The position within the measure is stored as a normalized numerator/denominator pair, so that hashing and
+    comparisons only ever operate on integers. :attr:`position` converts it to a fraction on demand.
+    """
 
     measure: int
-    position: Fraction
+    _num: int
+    _den: int
+    # Time points are used as dict keys everywhere, so the hash is computed once and stored
+    _hash: int = field(init=False)
+    _position: Fraction = field(init=False)
 
     def __init__(self, measure: int | None = None, count: int | None = None, subdivision: int | None = None, /):
         if measure is None:
             measure = 1
         if count is None and subdivision is None:
-            count = 0
-            subdivision = 1
-        elif count is not None and subdivision is not None:
-            pass
-        else:
+            # Start of a measure, where only the measure number needs to be checked
+            if measure < 0:
+                raise ValueError(f"measure cannot be negative (got {measure})")
+            self._store(measure, 0, 1)
+            return
+        if count is None or subdivision is None:
             raise ValueError(f"count and division must be both given or not given")
         self.validate(measure, count, subdivision)
+        self._store(measure, count, subdivision)
+
+    @classmethod
+    def _unchecked(cls, measure: int, count: int, subdivision: int) -> "TimePoint":
+        """
+        Construct a time point without performing validation.
+
+        This is intended for time points derived from values that are already known to be valid.
+        """
+        obj = object.__new__(cls)
+        obj._store(measure, count, subdivision)
+        return obj
+
+    def _store(self, measure: int, count: int, subdivision: int) -> None:
+        divisor = gcd(count, subdivision)
         object.__setattr__(self, "measure", measure)
-        object.__setattr__(self, "position", Fraction(count, subdivision))
+        object.__setattr__(self, "_num", count // divisor)
+        object.__setattr__(self, "_den", subdivision // divisor)
+        object.__setattr__(self, "_hash", hash((measure, self._num, self._den)))
+
+    @property
+    def position(self) -> Fraction:
+        """The position of this time point within its measure, as a fraction of a whole note."""
+        try:
+            return self._position
+        except AttributeError:
+            position = _position_to_fraction(self._num, self._den)
+            object.__setattr__(self, "_position", position)
+            return position
+
+    def __reduce__(self) -> tuple:
+        # The position slot is only filled on first access, so rebuild the time point from its integer fields instead
+        return self._unchecked, (self.measure, self._num, self._den)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(measure={self.measure!r}, position={self.position!r})"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TimePoint):
+            return NotImplemented
+        return self.measure == other.measure and self._num == other._num and self._den == other._den
+
+    # Comparisons are written out by hand to avoid the extra dispatch of functools.total_ordering
+    def __lt__(self, other: "TimePoint") -> bool:
+        if not isinstance(other, TimePoint):
+            return NotImplemented
+        if self.measure != other.measure:
+            return self.measure < other.measure
+        return self._num * other._den < other._num * self._den
+
+    def __le__(self, other: "TimePoint") -> bool:
+        if not isinstance(other, TimePoint):
+            return NotImplemented
+        if self.measure != other.measure:
+            return self.measure < other.measure
+        return self._num * other._den <= other._num * self._den
+
+    def __gt__(self, other: "TimePoint") -> bool:
+        if not isinstance(other, TimePoint):
+            return NotImplemented
+        if self.measure != other.measure:
+            return self.measure > other.measure
+        return self._num * other._den > other._num * self._den
+
+    def __ge__(self, other: "TimePoint") -> bool:
+        if not isinstance(other, TimePoint):
+            return NotImplemented
+        if self.measure != other.measure:
+            return self.measure > other.measure
+        return self._num * other._den >= other._num * self._den
 
     def validate(self, measure: int, count: int, subdivision: int):
         if measure < 0:
@@ -10,7 +10,7 @@ import time
 from decimal import Decimal, InvalidOperation
 from fractions import Fraction
 from pathlib import Path
-from typing import TextIO
+from typing import Callable, TextIO
 from xml.sax.saxutils import escape
 
 from .base import (
@@ -39,6 +39,8 @@ from ..classes.enums import (
     NoteType,
     SegmentFlag,
     SpinType,
+    SEGMENT_END_BIT,
+    SEGMENT_START_BIT,
     TiltType,
 )
 from ..classes.time import (
@@ -65,6 +67,14 @@ LASER_POSITION = [
     "0257ACFHKMPSUXZbehjmo",
     "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmno",
 ]
+# Lookup table for laser positions, built once so that conversion doesn't scan the position strings
+# The position strings are added in reverse, so that earlier ones take precedence like when scanning them in order
+_LASER_POSITION_MAP: dict[str, Fraction] = {
+    laser_char: Fraction(laser_pos, len(laser_str) - 1)
+    for laser_str in reversed(LASER_POSITION)
+    for laser_pos, laser_char in enumerate(laser_str)
+}
+_LASER_POSITION_DEFAULT = Fraction()
 INPUT_BT = ["bt_a", "bt_b", "bt_c", "bt_d"]
 INPUT_FX = ["fx_l", "fx_r"]
 INPUT_VOL = ["vol_l", "vol_r"]
@@ -109,6 +119,11 @@ ZOOM_BOTTOM_CONVERSION_RATE = Decimal("-0.006667")
 ZOOM_TOP_CONVERSION_RATE = Decimal("0.002222")
 TILT_CONVERSION_RATE = Decimal("-0.420000")
 LANE_SPLIT_CONVERSION_RATE = Decimal("0.006667")
+# Templates for the fixed-width rows of the VOX output, bound once so that each row is a single call
+_BT_VOX_ROW = "{}\t{}\t0\n".format
+_FX_VOX_ROW = "{}\t{}\t{}\n".format
+_VOL_VOX_ROW = "{}\t{:.6f}\t{}\t{}\t{}\t{}\t0\t{}\t{}\n".format
+_SPCONTROLLER_VOX_ROW = "{}\t{}\t2\t{}\t{:.2f}\t{:.2f}\t{:.2f}\t0.00\n".format
 
 logger = logging.getLogger(__name__)
 
@@ -134,78 +149,94 @@ class _LastVolInfo:
 class KSHSongChartContainer(SongChartContainer):
     """Implementation of :class:`~sdvxparser.parser.base.SongChartContainer` for the KSH format."""
 
-    def _write_bt(self, f: TextIO, notedata: dict[TimePoint, BTInfo]):
+    def _write_bt(
+        self,
+        write: Callable[[str], None],
+        timepoint_to_vox: Callable[[TimePoint], str],
+        notedata: dict[TimePoint, BTInfo],
+    ):
         for timept, bt in notedata.items():
             # What even is the last number for in BT holds?
-            f.write(f"{self.chart_info.timepoint_to_vox(timept)}\t{bt.duration_as_tick()}\t0\n")
-
-    def _write_fx(self, f: TextIO, notedata: dict[TimePoint, FXInfo]):
+            write(_BT_VOX_ROW(timepoint_to_vox(timept), bt.duration_as_tick()))
+
+    def _write_fx(
+        self,
+        write: Callable[[str], None],
+        timepoint_to_vox: Callable[[TimePoint], str],
+        notedata: dict[TimePoint, FXInfo],
+    ):
         for timept, fx in notedata.items():
             if fx.duration == 0:
-                f.write(f"{self.chart_info.timepoint_to_vox(timept)}\t{fx.duration_as_tick()}\t{fx.special}\n")
+                write(_FX_VOX_ROW(timepoint_to_vox(timept), fx.duration_as_tick(), fx.special))
             else:
-                f.write(f"{self.chart_info.timepoint_to_vox(timept)}\t{fx.duration_as_tick()}\t{fx.special + 2}\n")
-
-    def _write_vol(self, f: TextIO, notedata: dict[TimePoint, VolInfo], apply_ease: bool):
+                write(_FX_VOX_ROW(timepoint_to_vox(timept), fx.duration_as_tick(), fx.special + 2))
+
+    def _write_vol(
+        self,
+        write: Callable[[str], None],
+        timepoint_to_vox: Callable[[TimePoint], str],
+        notedata: dict[TimePoint, VolInfo],
+        apply_ease: bool,
+    ):
         for timept, vol in notedata.items():
             if not apply_ease and vol.interpolated:
                 continue
             wide_indicator = 2 if vol.wide_laser else 1
+            vox_timept = timepoint_to_vox(timept)
+            filter_index = vol.filter_index.value
+            ease_type = vol.ease_type.value
             # Not slam
             if vol.start == vol.end:
-                f.write(
-                    "\t".join(
-                        [
-                            f"{self.chart_info.timepoint_to_vox(timept)}",
-                            f"{float(vol.start):.6f}",
-                            f"{vol.point_type.value}",
-                            f"{vol.spin_type.value}",
-                            f"{vol.filter_index.value}",
-                            f"{wide_indicator}",
-                            "0",
-                            f"{vol.ease_type.value}",
-                            f"{vol.spin_duration}\n",
-                        ]
+                write(
+                    _VOL_VOX_ROW(
+                        vox_timept,
+                        float(vol.start),
+                        vol.point_type.value,
+                        vol.spin_type.value,
+                        filter_index,
+                        wide_indicator,
+                        ease_type,
+                        vol.spin_duration,
                     )
                 )
             # Slam
             else:
-                vol_flag_start = 1 if SegmentFlag.START in vol.point_type else 0
-                vol_flag_end = 2 if SegmentFlag.END in vol.point_type else 0
-                f.write(
-                    "\t".join(
-                        [
-                            f"{self.chart_info.timepoint_to_vox(timept)}",
-                            f"{float(vol.start):.6f}",
-                            f"{vol_flag_start}",
-                            f"{vol.spin_type.value}",
-                            f"{vol.filter_index.value}",
-                            f"{wide_indicator}",
-                            "0",
-                            f"{vol.ease_type.value}",
-                            f"{vol.spin_duration}\n",
-                        ]
+                vol_flag_start = vol.point_type.value & SEGMENT_START_BIT
+                vol_flag_end = vol.point_type.value & SEGMENT_END_BIT
+                write(
+                    _VOL_VOX_ROW(
+                        vox_timept,
+                        float(vol.start),
+                        vol_flag_start,
+                        vol.spin_type.value,
+                        filter_index,
+                        wide_indicator,
+                        ease_type,
+                        vol.spin_duration,
                     )
                 )
-                f.write(
-                    "\t".join(
-                        [
-                            f"{self.chart_info.timepoint_to_vox(timept)}",
-                            f"{float(vol.end):.6f}",
-                            f"{vol_flag_end}",
-                            "0",
-                            f"{vol.filter_index.value}",
-                            f"{wide_indicator}",
-                            "0",
-                            f"{vol.ease_type.value}",
-                            "0\n",
-                        ]
+                write(
+                    _VOL_VOX_ROW(
+                        vox_timept, float(vol.end), vol_flag_end, 0, filter_index, wide_indicator, ease_type, 0
                     )
                 )
 
     def write_vox(self, f: TextIO):
+        # Lines are collected in memory and written to the file at once, instead of one write per line
+        vox_parts: list[str] = []
+        write = vox_parts.append
+
+        # Laser points are written to several tracks, so each time point is only converted once per export
+        vox_timepts: dict[TimePoint, str] = {}
+
+        def timepoint_to_vox(timept: TimePoint) -> str:
+            vox_timept = vox_timepts.get(timept)
+            if vox_timept is None:
+                vox_timept = vox_timepts[timept] = self.chart_info.timepoint_to_vox(timept)
+            return vox_timept
+
         # Header
-        f.write(
+        write(
             dedent(
                 f"""
                 //====================================
@@ -218,7 +249,7 @@ class KSHSongChartContainer(SongChartContainer):
         )
 
         # VOX version
-        f.write(
+        write(
             dedent(
                 f"""
                 #FORMAT VERSION
@@ -230,14 +261,14 @@ class KSHSongChartContainer(SongChartContainer):
         )
 
         # Time signatures
-        f.write("#BEAT INFO\n")
+        write("#BEAT INFO\n")
         for timept, timesig in self.chart_info.timesigs.items():
-            f.write(f"{self.chart_info.timepoint_to_vox(timept)}\t{timesig.upper}\t{timesig.lower}\n")
-        f.write("#END\n")
-        f.write("\n")
+            write(f"{timepoint_to_vox(timept)}\t{timesig.upper}\t{timesig.lower}\n")
+        write("#END\n")
+        write("\n")
 
         # BPMs
-        f.write("#BPM INFO\n")
+        write("#BPM INFO\n")
         timepoint_set = set(self.chart_info.bpms.keys())
         timepoint_set.update(self.chart_info.stops.keys())
         current_bpm = Decimal("120")
@@ -247,25 +278,25 @@ class KSHSongChartContainer(SongChartContainer):
                 current_bpm = self.chart_info.bpms[timept]
             if timept in self.chart_info.stops:
                 is_stop_active = self.chart_info.stops[timept]
-            f.write(f"{self.chart_info.timepoint_to_vox(timept)}\t{current_bpm:.2f}\t4")
+            write(f"{timepoint_to_vox(timept)}\t{current_bpm:.2f}\t4")
             if is_stop_active:
-                f.write("-")
-            f.write("\n")
-        f.write("#END\n")
-        f.write("\n")
+                write("-")
+            write("\n")
+        write("#END\n")
+        write("\n")
 
         # Tilt modes
-        f.write("#TILT MODE INFO\n")
+        write("#TILT MODE INFO\n")
         prev_tilt_type: TiltType | None = None
         for timept, tilt_type in self.chart_info.tilt_type.items():
             if tilt_type != prev_tilt_type:
-                f.write(f"{self.chart_info.timepoint_to_vox(timept)}\t{tilt_type.value}\n")
+                write(f"{timepoint_to_vox(timept)}\t{tilt_type.value}\n")
             prev_tilt_type = tilt_type
-        f.write("#END\n")
-        f.write("\n")
+        write("#END\n")
+        write("\n")
 
         # Lyric info (unused)
-        f.write(
+        write(
             dedent(
                 """
                 #LYRIC INFO
@@ -276,7 +307,7 @@ class KSHSongChartContainer(SongChartContainer):
         )
 
         # End position
-        f.write(
+        write(
             dedent(
                 f"""
                 #END POSITION
@@ -286,33 +317,33 @@ class KSHSongChartContainer(SongChartContainer):
                 """
             )
         )
-        f.write("\n")
+        write("\n")
 
         # Filter parameters
-        f.write("#TAB EFFECT INFO\n")
+        write("#TAB EFFECT INFO\n")
         for filter in self.chart_info.filter_list:
-            f.write(filter.to_vox_string())
-            f.write("\n")
-        f.write("#END\n")
-        f.write("\n")
+            write(filter.to_vox_string())
+            write("\n")
+        write("#END\n")
+        write("\n")
 
         # FX parameters
-        f.write("#FXBUTTON EFFECT INFO\n")
+        write("#FXBUTTON EFFECT INFO\n")
         for effect in self.chart_info.effect_list:
-            f.write(effect.to_vox_string())
-            f.write("\n")
-        f.write("#END\n")
-        f.write("\n")
+            write(effect.to_vox_string())
+            write("\n")
+        write("#END\n")
+        write("\n")
 
         # Tab parameters (FX on lasers parameters)
-        f.write("#TAB PARAM ASSIGN INFO\n")
+        write("#TAB PARAM ASSIGN INFO\n")
         for autotab in self.chart_info.autotab_list:
-            f.write(autotab.to_vox_string())
-        f.write("#END\n")
-        f.write("\n")
+            write(autotab.to_vox_string())
+        write("#END\n")
+        write("\n")
 
         # Reverb effect param (unused)
-        f.write(
+        write(
             dedent(
                 """
                 #REVERB EFFECT PARAM
@@ -323,7 +354,7 @@ class KSHSongChartContainer(SongChartContainer):
         )
 
         # == TRACK INFO ==
-        f.write(
+        write(
             dedent(
                 """
                 //====================================
@@ -335,93 +366,93 @@ class KSHSongChartContainer(SongChartContainer):
         )
 
         # Note data (TRACK1~8)
-        f.write("#TRACK1\n")
-        self._write_vol(f, self.chart_info.note_data.vol_l, apply_ease=True)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK1\n")
+        self._write_vol(write, timepoint_to_vox, self.chart_info.note_data.vol_l, apply_ease=True)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK2\n")
-        self._write_fx(f, self.chart_info.note_data.fx_l)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK2\n")
+        self._write_fx(write, timepoint_to_vox, self.chart_info.note_data.fx_l)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK3\n")
-        self._write_bt(f, self.chart_info.note_data.bt_a)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK3\n")
+        self._write_bt(write, timepoint_to_vox, self.chart_info.note_data.bt_a)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK4\n")
-        self._write_bt(f, self.chart_info.note_data.bt_b)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK4\n")
+        self._write_bt(write, timepoint_to_vox, self.chart_info.note_data.bt_b)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK5\n")
-        self._write_bt(f, self.chart_info.note_data.bt_c)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK5\n")
+        self._write_bt(write, timepoint_to_vox, self.chart_info.note_data.bt_c)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK6\n")
-        self._write_bt(f, self.chart_info.note_data.bt_d)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK6\n")
+        self._write_bt(write, timepoint_to_vox, self.chart_info.note_data.bt_d)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK7\n")
-        self._write_fx(f, self.chart_info.note_data.fx_r)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK7\n")
+        self._write_fx(write, timepoint_to_vox, self.chart_info.note_data.fx_r)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
-        f.write("#TRACK8\n")
-        self._write_vol(f, self.chart_info.note_data.vol_r, apply_ease=True)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK8\n")
+        self._write_vol(write, timepoint_to_vox, self.chart_info.note_data.vol_r, apply_ease=True)
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
         # Track auto tab (FX on lasers activation)
-        f.write("#TRACK AUTO TAB\n")
+        write("#TRACK AUTO TAB\n")
         for timept, autotab_info in self.chart_info.autotab_infos.items():
             tick_amt = round(TICKS_PER_BAR * autotab_info.duration)
-            f.write(
+            write(
                 "\t".join(
                     [
-                        f"{self.chart_info.timepoint_to_vox(timept)}",
+                        f"{timepoint_to_vox(timept)}",
                         f"{tick_amt}",
                         f"{autotab_info.which + 2}\n",
                     ]
                 )
             )
-        f.write("#END\n")
-        f.write("\n")
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n\n")
+        write("//====================================\n\n")
 
         # Original TRACK1/8
-        f.write("#TRACK ORIGINAL L\n")
-        self._write_vol(f, self.chart_info.note_data.vol_l, apply_ease=False)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK ORIGINAL L\n")
+        self._write_vol(write, timepoint_to_vox, self.chart_info.note_data.vol_l, apply_ease=False)
+        write("#END\n")
+        write("\n")
 
-        f.write("#TRACK ORIGINAL R\n")
-        self._write_vol(f, self.chart_info.note_data.vol_r, apply_ease=False)
-        f.write("#END\n")
-        f.write("\n")
+        write("#TRACK ORIGINAL R\n")
+        self._write_vol(write, timepoint_to_vox, self.chart_info.note_data.vol_r, apply_ease=False)
+        write("#END\n")
+        write("\n")
 
         # == SPCONTROLER INFO == (sic)
-        f.write(
+        write(
             dedent(
                 """
                 //====================================
@@ -433,8 +464,8 @@ class KSHSongChartContainer(SongChartContainer):
         )
 
         # SPController data and default stuff I never tried to figure out
-        f.write("#SPCONTROLER\n")
-        f.write(
+        write("#SPCONTROLER\n")
+        write(
             "001,01,00\tRealize	3\t0\t36.12\t60.12\t110.12\t0.00\n"
             "001,01,00\tRealize	4\t0\t0.62\t0.72\t1.03\t0.00\n"
             "001,01,00\tAIRL_ScaX\t1\t0\t0.00\t1.00\t0.00\t0.00\n"
@@ -453,36 +484,11 @@ class KSHSongChartContainer(SongChartContainer):
             for timept_i, timept_f in itertools.pairwise(keys):
                 z_i = data_dict[timept_i]
                 z_f = data_dict[timept_f]
+                vox_timept = timepoint_to_vox(timept_i)
                 if z_i.is_snap():
-                    f.write(
-                        "\t".join(
-                            [
-                                f"{self.chart_info.timepoint_to_vox(timept_i)}",
-                                keyword,
-                                "2",
-                                "0",
-                                f"{z_i.start:.2f}",
-                                f"{z_i.end:.2f}",
-                                "0.00",
-                                "0.00\n",
-                            ]
-                        )
-                    )
+                    write(_SPCONTROLLER_VOX_ROW(vox_timept, keyword, 0, z_i.start, z_i.end, 0))
                 tick_amt = round(TICKS_PER_BAR * self.chart_info.get_distance(timept_i, timept_f))
-                f.write(
-                    "\t".join(
-                        [
-                            f"{self.chart_info.timepoint_to_vox(timept_i)}",
-                            keyword,
-                            "2",
-                            f"{tick_amt}",
-                            f"{z_i.end:.2f}",
-                            f"{z_f.start:.2f}",
-                            "0.00",
-                            "0.00\n",
-                        ]
-                    )
-                )
+                write(_SPCONTROLLER_VOX_ROW(vox_timept, keyword, tick_amt, z_i.end, z_f.start, 0))
 
         # Tilt info  -> Tilt
         # Lane split -> Morphing2
@@ -504,19 +510,8 @@ class KSHSongChartContainer(SongChartContainer):
                         if SegmentFlag.END in sp_i.point_type
                         else 0
                     )
-                    f.write(
-                        "\t".join(
-                            [
-                                f"{self.chart_info.timepoint_to_vox(timept_i)}",
-                                keyword,
-                                "2",
-                                "0",
-                                f"{sp_i.start:.2f}",
-                                f"{sp_i.end:.2f}",
-                                f"{point_flag:.2f}",
-                                "0.00\n",
-                            ]
-                        )
+                    write(
+                        _SPCONTROLLER_VOX_ROW(timepoint_to_vox(timept_i), keyword, 0, sp_i.start, sp_i.end, point_flag)
                     )
                 # Don't add another entry if sp_i is the tail end of a segment
                 if SegmentFlag.END in sp_i.point_type:
@@ -535,18 +530,9 @@ class KSHSongChartContainer(SongChartContainer):
                     else 0
                 )
                 tick_amt = round(TICKS_PER_BAR * self.chart_info.get_distance(timept_i, timept_f))
-                f.write(
-                    "\t".join(
-                        [
-                            f"{self.chart_info.timepoint_to_vox(timept_i)}",
-                            keyword,
-                            "2",
-                            f"{tick_amt}",
-                            f"{sp_i.end:.2f}",
-                            f"{sp_f.start:.2f}",
-                            f"{point_flag:.2f}",
-                            "0.00\n",
-                        ]
+                write(
+                    _SPCONTROLLER_VOX_ROW(
+                        timepoint_to_vox(timept_i), keyword, tick_amt, sp_i.end, sp_f.start, point_flag
                     )
                 )
 
@@ -554,10 +540,10 @@ class KSHSongChartContainer(SongChartContainer):
         bars_hidden = False
         for timept, hide_bars in self.chart_info.spcontroller_data.hidden_bars.items():
             if hide_bars != bars_hidden:
-                f.write(
+                write(
                     "\t".join(
                         [
-                            f"{self.chart_info.timepoint_to_vox(timept)}",
+                            f"{timepoint_to_vox(timept)}",
                             "BAROFF",
                             "0",
                             "0",
@@ -572,10 +558,10 @@ class KSHSongChartContainer(SongChartContainer):
 
         # BAR data
         for timept in self.chart_info.spcontroller_data.manual_bars:
-            f.write(
+            write(
                 "\t".join(
                     [
-                        f"{self.chart_info.timepoint_to_vox(timept)}",
+                        f"{timepoint_to_vox(timept)}",
                         "BAR",
                         "0",
                         "0",
@@ -587,32 +573,32 @@ class KSHSongChartContainer(SongChartContainer):
                 )
             )
 
-        f.write("#END\n")
-        f.write("\n")
+        write("#END\n")
+        write("\n")
 
-        f.write("//====================================\n")
+        write("//====================================\n")
 
         if self.chart_info.script_ids:
-            f.write("\n")
-            f.write("#SCRIPT_DEFINE\n")
-            f.write("\n")
-            f.write("// Define your scripts here!\n")
+            write("\n")
+            write("#SCRIPT_DEFINE\n")
+            write("\n")
+            write("// Define your scripts here!\n")
 
             all_script_ids: set[int] = set()
             for script_dict in self.chart_info.script_ids.values():
                 all_script_ids.update(*script_dict.values())
 
             for sid in sorted(all_script_ids):
-                f.write(f"@SCRIPTSTART {sid}\n" f"\n" f"@SCRIPTEND\n\n")
+                write(f"@SCRIPTSTART {sid}\n" f"\n" f"@SCRIPTEND\n\n")
 
-            f.write("#END\n")
-            f.write("\n")
+            write("#END\n")
+            write("\n")
 
             for note_type in reversed(NoteType):
                 if note_type == NoteType.DUMMY:
                     continue
                 script_dict = self.chart_info.script_ids[note_type]
-                f.write(f"#SCRIPTED_TRACK{NOTE_TYPE_TRACK_MAP[note_type]}\n")
+                write(f"#SCRIPTED_TRACK{NOTE_TYPE_TRACK_MAP[note_type]}\n")
                 for timept_i, timept_f in itertools.pairwise(script_dict):
                     if not script_dict[timept_i]:
                         continue
@@ -641,11 +627,13 @@ class KSHSongChartContainer(SongChartContainer):
                     timepts = [t for t in note_dict.keys() if timept_i <= t < timept_f]
                     script_ids = " ".join(str(v) for v in script_dict[timept_i])
                     for timept in timepts:
-                        f.write(f"{self.chart_info.timepoint_to_vox(timept)} {script_ids}\n")
-                f.write(f"#END\n")
-                f.write(f"\n")
+                        write(f"{timepoint_to_vox(timept)} {script_ids}\n")
+                write(f"#END\n")
+                write(f"\n")
+
+            write("//====================================\n")
 
-            f.write("//====================================\n")
+        f.write("".join(vox_parts))
 
     def write_xml(self, f: TextIO):
         f.write(
@@ -718,11 +706,7 @@ class KSHSongChartContainer(SongChartContainer):
 
 def convert_laser_pos(s: str) -> Fraction:
     """Convert laser position according to KSH specifications to a fraction."""
-    for laser_str in LASER_POSITION:
-        if s in laser_str:
-            laser_pos = laser_str.index(s)
-            return Fraction(laser_pos, len(laser_str) - 1)
-    return Fraction()
+    return _LASER_POSITION_MAP.get(s, _LASER_POSITION_DEFAULT)
 
 
 class KSHParser(Parser):
@@ -848,14 +832,20 @@ class KSHParser(Parser):
     def parse(self, file: TextIO) -> KSHSongChartContainer:
         self._file_path = Path(file.name).resolve()
 
+        # Charts are small enough to be read in one go
+        lines = file.read().split("\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        line_iter = iter(lines)
+
         self._raw_metadata = []
-        for line in file:
+        for line in line_iter:
             line = line.strip()
             if line == BAR_LINE:
                 break
-            self._raw_metadata.append(line.strip())
+            self._raw_metadata.append(line)
 
-        self._raw_notedata = [line.strip() for line in file]
+        self._raw_notedata = [line.strip() for line in line_iter]
 
         self._raw_definitions = []
         while True:
@@ -904,12 +894,12 @@ class KSHParser(Parser):
                 elif key == "t":
                     if "-" in value:
                         min_bpm_str, max_bpm_str = value.split("-")
-                        self.__song_chart_data.song_info.min_bpm = Decimal(min_bpm_str)
-                        self.__song_chart_data.song_info.max_bpm = Decimal(max_bpm_str)
+                        self.__song_chart_data.song_info.min_bpm = float(min_bpm_str)
+                        self.__song_chart_data.song_info.max_bpm = float(max_bpm_str)
                     else:
                         bpm = Decimal(value)
-                        self.__song_chart_data.song_info.min_bpm = bpm
-                        self.__song_chart_data.song_info.max_bpm = bpm
+                        self.__song_chart_data.song_info.min_bpm = float(bpm)
+                        self.__song_chart_data.song_info.max_bpm = float(bpm)
                         self.__song_chart_data.chart_info.bpms[TimePoint()] = bpm
                 elif key == "beat":
                     upper_str, lower_str = value.split("/")
@@ -1030,14 +1020,15 @@ class KSHParser(Parser):
 
     def _parse_measure(self, measure: list[str], m_no: int, m_linecount: int) -> None:
         # Check time signatures that get pushed to the next measure
-        if TimePoint(m_no, 0, 1) in self.__song_chart_data.chart_info.timesigs:
-            self._cur_timesig = self.__song_chart_data.chart_info.timesigs[TimePoint(m_no, 0, 1)]
+        m_start = TimePoint._unchecked(m_no, 0, 1)
+        if m_start in self.__song_chart_data.chart_info.timesigs:
+            self._cur_timesig = self.__song_chart_data.chart_info.timesigs[m_start]
 
         noteline_count = 0
         for line in measure:
             subdivision = Fraction(1 * self._cur_timesig.upper, m_linecount * self._cur_timesig.lower)
             cur_subdiv = noteline_count * subdivision
-            cur_time = TimePoint(m_no, cur_subdiv.numerator, cur_subdiv.denominator)
+            cur_time = TimePoint._unchecked(m_no, cur_subdiv.numerator, cur_subdiv.denominator)
 
             # 1. Comment
             if line.startswith("//"):
@@ -1452,10 +1443,11 @@ class KSHParser(Parser):
             if fxl_info.duration != fxr_info.duration:
                 continue
             # Copy over effects/SE if and only if one of them is unassigned
+            # FX objects are immutable, so the entry is replaced instead
             if fxl_info.special == 0 and fxr_info.special != 0:
-                fxl_info.special = fxr_info.special
+                self._fxs["fx_l"][cur_time] = FXInfo(fxl_info.duration, fxr_info.special)
             elif fxl_info.special != 0 and fxr_info.special == 0:
-                fxr_info.special = fxl_info.special
+                self._fxs["fx_r"][cur_time] = FXInfo(fxr_info.duration, fxl_info.special)
 
         # Apply spins
         # NOTE: Spin duration is given as number of 1/192nds regardless of time signature.
@@ -1612,7 +1604,7 @@ class KSHParser(Parser):
                     if time_i == time_f:
                         continue
                     # Ignore filter changes between segments
-                    if SegmentFlag.END in vol_data[time_i].point_type:
+                    if vol_data[time_i].point_type.value & SEGMENT_END_BIT:
                         continue
                     part_dist = self.__song_chart_data.chart_info.get_distance(time_i, timept)
                     total_dist = self.__song_chart_data.chart_info.get_distance(time_i, time_f)
@@ -1676,7 +1668,7 @@ class KSHParser(Parser):
             while len(self.__song_chart_data.chart_info.effect_list) < len(self._fx_list):
                 index = len(self.__song_chart_data.chart_info.effect_list)
                 self.__song_chart_data.chart_info.effect_list.append(effects.EffectEntry())
-                self.__song_chart_data.chart_info.autotab_list.append(filters.AutoTabEntry(index))
+                self.__song_chart_data.chart_info.autotab_list.append(filters.AutoTabEntry.from_index(index))
         for i, fx_entry in enumerate(self._fx_list):
             if ";" in fx_entry:
                 fx_name, *fx_params_str = fx_entry.split(";")
@@ -1689,11 +1681,11 @@ class KSHParser(Parser):
                 fx_params = []
             effect: effects.Effect
             if fx_name in KSH_EFFECT_MAP:
-                effect = KSH_EFFECT_MAP[fx_name].duplicate()
+                effect = KSH_EFFECT_MAP[fx_name]
             # Custom effect -- check definitions
             else:
-                effect = self.__song_chart_data.chart_info._custom_effect[fx_name].duplicate()
-            effect.map_params(fx_params)
+                effect = self.__song_chart_data.chart_info._custom_effect[fx_name]
+            effect = effect.map_params(fx_params)
             self.__song_chart_data.chart_info.effect_list[i] = effects.EffectEntry(effect)
 
         # Remove filters that are unused
@@ -1710,7 +1702,7 @@ class KSHParser(Parser):
             ):
                 index = len(self.__song_chart_data.chart_info.effect_list)
                 self.__song_chart_data.chart_info.effect_list.append(effects.EffectEntry())
-                self.__song_chart_data.chart_info.autotab_list.append(filters.AutoTabEntry(index))
+                self.__song_chart_data.chart_info.autotab_list.append(filters.AutoTabEntry.from_index(index))
         for i, name in enumerate(self.__song_chart_data.chart_info._custom_filter):
             filter_effect = self.__song_chart_data.chart_info._custom_filter[name]
             self.__song_chart_data.chart_info.effect_list[len(self._fx_list) + i] = effects.EffectEntry(filter_effect)